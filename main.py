@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """SSH Manager - Main entry point"""
 
+import functools
 import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtCore import Qt
-
-from ssh_manager import MainWindow, ConfigManager, CloseableTabBar
+from PyQt5.QtCore import Qt, QT_VERSION
 
 # --- Theme color definitions ---
 
@@ -60,9 +59,16 @@ LIGHT = {
 }
 
 
+# QColor is value-typed and QPalette.setColor copies it, so identical hex
+# strings across roles and themes can share one Python-side instance
+@functools.lru_cache(maxsize=128)
+def _qcolor(h: str) -> QColor:
+    return QColor(h)
+
+
 def _build_palette(c: dict) -> QPalette:
     p = QPalette()
-    _s = lambda hex_color: QColor(hex_color)
+    _s = _qcolor
     p.setColor(QPalette.Window, _s(c['window']))
     p.setColor(QPalette.WindowText, _s(c['window_text']))
     p.setColor(QPalette.Base, _s(c['base']))
@@ -82,191 +88,228 @@ def _build_palette(c: dict) -> QPalette:
     return p
 
 
-def _build_stylesheet(c: dict) -> str:
-    return f"""
+# QSS body parsed once at import; both theme variants share the template
+# and only pay str.format_map at build time. Colors with a 1:1 palette
+# role (window/text/base) are written as palette() references so the
+# parser lexes them once and the palette swap restyles them for free;
+# the surface/accent shades have no role and stay as hex placeholders.
+_QSS_TEMPLATE = """
     * {{ font-size: 12px; }}
 
-    QMainWindow, QDialog {{ background-color: {c['window']}; }}
+    QMainWindow, QDialog {{ background-color: palette(window); }}
     QDialog QWidget, QDialog QGroupBox {{ background-color: transparent; }}
-    QTabWidget > QWidget {{ background-color: {c['window']}; }}
+    QTabWidget > QWidget {{ background-color: palette(window); }}
 
     QToolTip {{
-        background-color: {c['tooltip_bg']}; color: {c['tooltip_text']};
-        border: 1px solid {c['surface1']}; padding: 3px 6px; border-radius: 4px;
+        background-color: {tooltip_bg}; color: {tooltip_text};
+        border: 1px solid {surface1}; padding: 3px 6px; border-radius: 4px;
     }}
     QMenu {{
-        background-color: {c['window']}; color: {c['text']};
-        border: 1px solid {c['surface1']}; border-radius: 4px; padding: 3px;
+        background-color: palette(window); color: palette(text);
+        border: 1px solid {surface1}; border-radius: 4px; padding: 3px;
     }}
     QMenu::item {{ padding: 5px 20px 5px 10px; border-radius: 3px; }}
-    QMenu::item:selected {{ background-color: {c['surface1']}; }}
-    QMenu::separator {{ height: 1px; background-color: {c['surface1']}; margin: 3px 6px; }}
+    QMenu::item:selected {{ background-color: {surface1}; }}
+    QMenu::separator {{ height: 1px; background-color: {surface1}; margin: 3px 6px; }}
 
     QMenuBar {{
-        background-color: {c['window']}; color: {c['text']}; padding: 1px;
+        background-color: palette(window); color: palette(text); padding: 1px;
     }}
     QMenuBar::item {{ padding: 3px 7px; border-radius: 4px; }}
-    QMenuBar::item:selected {{ background-color: {c['surface1']}; }}
+    QMenuBar::item:selected {{ background-color: {surface1}; }}
 
     QToolBar {{
-        background-color: {c['window']}; border: none;
-        border-bottom: 1px solid {c['surface0']}; padding: 2px; spacing: 2px;
+        background-color: palette(window); border: none;
+        border-bottom: 1px solid {surface0}; padding: 2px; spacing: 2px;
     }}
-    QToolBar::separator {{ width: 1px; background-color: {c['surface1']}; margin: 3px 6px; }}
+    QToolBar::separator {{ width: 1px; background-color: {surface1}; margin: 3px 6px; }}
     QToolButton {{
         background: transparent; border: 1px solid transparent;
-        border-radius: 4px; padding: 4px 8px; color: {c['text']};
+        border-radius: 4px; padding: 4px 8px; color: palette(text);
     }}
-    QToolButton:hover {{ background-color: {c['surface0']}; border-color: {c['surface1']}; }}
-    QToolButton:pressed {{ background-color: {c['surface1']}; }}
+    QToolButton:hover {{ background-color: {surface0}; border-color: {surface1}; }}
+    QToolButton:pressed {{ background-color: {surface1}; }}
 
     QTabWidget::pane {{
-        border: 1px solid {c['surface0']}; border-radius: 4px;
-        background-color: {c['window']};
+        border: 1px solid {surface0}; border-radius: 4px;
+        background-color: palette(window);
     }}
     QTabBar {{ background-color: transparent; }}
     QTabBar::tab {{
-        background-color: {c['tab_bg']}; color: {c['tab_text']};
-        padding: 5px 14px; border: 1px solid {c['surface0']}; border-bottom: none;
+        background-color: {tab_bg}; color: {tab_text};
+        padding: 5px 14px; border: 1px solid {surface0}; border-bottom: none;
         border-top-left-radius: 5px; border-top-right-radius: 5px;
         margin-right: 2px; min-width: 80px;
     }}
     QTabBar::tab:selected {{
-        background-color: {c['window']}; color: {c['text']};
-        border-bottom: 2px solid {c['accent']};
+        background-color: palette(window); color: palette(text);
+        border-bottom: 2px solid {accent};
     }}
-    QTabBar::tab:hover:!selected {{ background-color: {c['surface0']}; color: {c['text']}; }}
+    QTabBar::tab:hover:!selected {{ background-color: {surface0}; color: palette(text); }}
 
     QHeaderView::section {{
-        background-color: {c['surface0']}; color: {c['text']};
+        background-color: {surface0}; color: palette(text);
         padding: 5px 8px; border: none;
-        border-right: 1px solid {c['surface1']}; border-bottom: 1px solid {c['surface1']};
+        border-right: 1px solid {surface1}; border-bottom: 1px solid {surface1};
         font-weight: 500;
     }}
 
     QScrollBar:vertical {{
-        background-color: {c['scrollbar_bg']}; width: 10px; border-radius: 5px;
+        background-color: {scrollbar_bg}; width: 10px; border-radius: 5px;
     }}
     QScrollBar::handle:vertical {{
-        background-color: {c['scrollbar_handle']}; min-height: 24px;
+        background-color: {scrollbar_handle}; min-height: 24px;
         border-radius: 4px; margin: 1px;
     }}
-    QScrollBar::handle:vertical:hover {{ background-color: {c['scrollbar_hover']}; }}
+    QScrollBar::handle:vertical:hover {{ background-color: {scrollbar_hover}; }}
     QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
     QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{ background: none; }}
 
     QScrollBar:horizontal {{
-        background-color: {c['scrollbar_bg']}; height: 10px; border-radius: 5px;
+        background-color: {scrollbar_bg}; height: 10px; border-radius: 5px;
     }}
     QScrollBar::handle:horizontal {{
-        background-color: {c['scrollbar_handle']}; min-width: 24px;
+        background-color: {scrollbar_handle}; min-width: 24px;
         border-radius: 4px; margin: 1px;
     }}
-    QScrollBar::handle:horizontal:hover {{ background-color: {c['scrollbar_hover']}; }}
+    QScrollBar::handle:horizontal:hover {{ background-color: {scrollbar_hover}; }}
     QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{ width: 0px; }}
     QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{ background: none; }}
 
     QGroupBox {{
-        border: 1px solid {c['surface1']}; border-radius: 6px;
+        border: 1px solid {surface1}; border-radius: 6px;
         margin-top: 6px; padding: 6px; padding-top: 22px; font-weight: 500;
     }}
     QGroupBox::title {{
         subcontrol-origin: margin; subcontrol-position: top left;
-        left: 8px; top: 6px; padding: 0 4px; color: {c['accent']};
+        left: 8px; top: 6px; padding: 0 4px; color: {accent};
     }}
 
-    QLabel {{ color: {c['text']}; }}
+    QLabel {{ color: palette(text); }}
+    QLabel#sectionHeader {{ font-weight: bold; color: {accent}; }}
+    QLabel#hint {{ color: {overlay}; font-size: 11px; font-style: italic; }}
 
     QLineEdit, QSpinBox, QTextEdit {{
-        background-color: {c['input_bg']}; border: 1px solid {c['input_border']};
-        border-radius: 5px; padding: 4px 8px; color: {c['text']};
-        selection-background-color: {c['selection_bg']};
+        background-color: {input_bg}; border: 1px solid {input_border};
+        border-radius: 5px; padding: 4px 8px; color: palette(text);
+        selection-background-color: {selection_bg};
     }}
     QLineEdit:focus, QSpinBox:focus, QTextEdit:focus {{
-        border: 1px solid {c['accent']};
+        border: 1px solid {accent};
     }}
     QLineEdit:disabled, QSpinBox:disabled {{
-        background-color: {c['base']}; color: {c['subtext']};
+        background-color: palette(base); color: {subtext};
         font-size: 11px;
     }}
     QLineEdit:read-only {{
-        background-color: {c['base']}; color: {c['subtext']};
+        background-color: palette(base); color: {subtext};
     }}
 
     QComboBox {{
-        background-color: {c['input_bg']}; border: 1px solid {c['input_border']};
-        border-radius: 5px; padding: 4px 8px; color: {c['text']}; min-height: 18px;
+        background-color: {input_bg}; border: 1px solid {input_border};
+        border-radius: 5px; padding: 4px 8px; color: palette(text); min-height: 18px;
     }}
-    QComboBox:focus {{ border: 1px solid {c['accent']}; }}
+    QComboBox:focus {{ border: 1px solid {accent}; }}
     QComboBox::drop-down {{ border: none; padding-right: 6px; }}
     QComboBox::down-arrow {{ width: 10px; height: 10px; }}
     QComboBox QAbstractItemView {{
-        background-color: {c['input_bg']}; border: 1px solid {c['input_border']};
-        border-radius: 5px; selection-background-color: {c['surface1']}; padding: 3px;
+        background-color: {input_bg}; border: 1px solid {input_border};
+        border-radius: 5px; selection-background-color: {surface1}; padding: 3px;
     }}
 
     QPushButton {{
-        background-color: {c['btn_bg']}; border: 1px solid {c['btn_border']};
-        border-radius: 5px; padding: 5px 12px; color: {c['text']};
+        background-color: {btn_bg}; border: 1px solid {btn_border};
+        border-radius: 5px; padding: 5px 12px; color: palette(text);
         font-weight: 500; min-width: 60px;
     }}
-    QPushButton:hover {{ background-color: {c['surface2']}; border-color: {c['overlay']}; }}
-    QPushButton:pressed {{ background-color: {c['surface0']}; }}
+    QPushButton:hover {{ background-color: {surface2}; border-color: {overlay}; }}
+    QPushButton:pressed {{ background-color: {surface0}; }}
     QPushButton:disabled {{
-        background-color: {c['base']}; color: {c['overlay']};
-        border-color: {c['surface0']};
+        background-color: palette(base); color: {overlay};
+        border-color: {surface0};
     }}
 
     QTreeWidget {{
-        background-color: {c['tree_bg']}; border: 1px solid {c['tree_border']};
+        background-color: {tree_bg}; border: 1px solid {tree_border};
         border-radius: 5px; padding: 2px; outline: none;
     }}
     QTreeWidget::item {{ padding: 4px 8px; border-radius: 3px; margin: 1px 2px; }}
-    QTreeWidget::item:hover {{ background-color: {c['tree_hover']}; }}
-    QTreeWidget::item:selected {{ background-color: {c['tree_selected']}; color: {c['text']}; }}
+    QTreeWidget::item:hover {{ background-color: {tree_hover}; }}
+    QTreeWidget::item:selected {{ background-color: {tree_selected}; color: palette(text); }}
 
-    QSplitter::handle {{ background-color: {c['splitter']}; width: 2px; }}
-    QSplitter::handle:hover {{ background-color: {c['accent']}; }}
+    QSplitter::handle {{ background-color: {splitter}; width: 2px; }}
+    QSplitter::handle:hover {{ background-color: {accent}; }}
 
-    QCheckBox {{ spacing: 8px; color: {c['text']}; }}
+    QCheckBox {{ spacing: 8px; color: palette(text); }}
     QCheckBox::indicator {{
         width: 16px; height: 16px;
-        border: 2px solid {c['check_border']}; border-radius: 3px;
-        background-color: {c['check_bg']};
+        border: 2px solid {check_border}; border-radius: 3px;
+        background-color: {check_bg};
     }}
     QCheckBox::indicator:checked {{
-        background-color: {c['accent']}; border-color: {c['accent']};
+        background-color: {accent}; border-color: {accent};
     }}
-    QCheckBox::indicator:hover {{ border-color: {c['accent']}; }}
+    QCheckBox::indicator:hover {{ border-color: {accent}; }}
 
     QTableWidget {{
-        background-color: {c['base']}; border: 1px solid {c['tree_border']};
-        border-radius: 5px; gridline-color: {c['surface0']}; outline: none;
+        background-color: palette(base); border: 1px solid {tree_border};
+        border-radius: 5px; gridline-color: {surface0}; outline: none;
     }}
     QTableWidget::item {{ padding: 5px; }}
-    QTableWidget::item:selected {{ background-color: {c['tree_selected']}; }}
+    QTableWidget::item:selected {{ background-color: {tree_selected}; }}
 
     QProgressBar {{
-        background-color: {c['progress_bg']}; border: none;
-        border-radius: 3px; text-align: center; color: {c['text']};
+        background-color: {progress_bg}; border: none;
+        border-radius: 3px; text-align: center; color: palette(text);
     }}
-    QProgressBar::chunk {{ background-color: {c['accent']}; border-radius: 3px; }}
+    QProgressBar::chunk {{ background-color: {accent}; border-radius: 3px; }}
 
     QStatusBar {{
-        background-color: {c['status_bg']}; border-top: 1px solid {c['status_border']};
-        color: {c['subtext']}; padding: 2px;
+        background-color: {status_bg}; border-top: 1px solid {status_border};
+        color: {subtext}; padding: 2px;
     }}
 
     QDialogButtonBox QPushButton {{ min-width: 80px; }}
     """
 
 
+def _build_stylesheet(c: dict) -> str:
+    return _QSS_TEMPLATE.format_map(c)
+
+
+# The color dicts are constants, so palette and stylesheet are pure
+# functions of the theme name — build each at most once per process
+@functools.lru_cache(maxsize=4)
+def _cached_palette(theme: str) -> QPalette:
+    return _build_palette(DARK if theme == "dark" else LIGHT)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_stylesheet(theme: str) -> str:
+    return _build_stylesheet(DARK if theme == "dark" else LIGHT)
+
+
+# Stylesheet currently installed on the application; re-sending the same
+# sheet would force Qt to re-polish every widget in the process
+_current_sheet = None
+
+
 def apply_theme(app: QApplication, theme: str):
     """Apply theme to application"""
-    colors = DARK if theme == "dark" else LIGHT
+    global _current_sheet
+    # Re-applying the current theme (settings saved unchanged) would
+    # still repolish every widget; one string compare skips all of it
+    if getattr(app, "_applied_theme", None) == theme:
+        return
     app.setStyle("Fusion")
-    app.setPalette(_build_palette(colors))
-    app.setStyleSheet(_build_stylesheet(colors))
+    app.setPalette(_cached_palette(theme))
+    sheet = _cached_stylesheet(theme)
+    if sheet != _current_sheet:
+        app.setStyleSheet(sheet)
+        _current_sheet = sheet
+    # Widgets that style themselves per theme can key off this property
+    app.setProperty("theme", theme)
+    app._applied_theme = theme
 
 
 def main():
@@ -274,13 +317,21 @@ def main():
     import os
     os.environ.pop("QT_QPA_PLATFORMTHEME", None)
 
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Qt 5.14+ handles high-DPI scaling itself; setting the legacy
+    # attributes there only triggers deprecation chatter at startup
+    if QT_VERSION < 0x050E00:
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     QApplication.setAttribute(Qt.AA_DontShowIconsInMenus, True)
 
     app = QApplication(sys.argv)
     app.setApplicationName("SSH Manager")
     app.setApplicationVersion("1.0.0")
+    app.processEvents()
+
+    # Import the package only after the QApplication exists — ssh_manager
+    # pulls in paramiko, pyte and pyserial, which dominate cold start
+    from ssh_manager import MainWindow, ConfigManager, CloseableTabBar
 
     # Force empty icon theme to prevent garbled platform icons on Arch/Wayland
     from PyQt5.QtGui import QIcon
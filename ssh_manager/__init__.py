@@ -1,4 +1,19 @@
 from .models import Connection, Folder, SSHConfig, SerialConfig, ConfigManager, AppSettings, DEFAULT_TERMINAL_SETTINGS, DEFAULT_LOGGING_SETTINGS
-from .sessions import SSHSession, SerialSession, list_serial_ports
-from .terminal import TerminalWidget
 from .mainwindow import MainWindow, CloseableTabBar
+
+# Session and terminal classes pull in paramiko/pyserial/pyte; resolve
+# them on first attribute access so importing the package stays light.
+_LAZY = {
+    'SSHSession': 'sessions',
+    'SerialSession': 'sessions',
+    'list_serial_ports': 'sessions',
+    'TerminalWidget': 'terminal',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f'.{module}', __name__), name)
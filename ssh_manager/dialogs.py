@@ -3,19 +3,27 @@
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QLineEdit, QSpinBox, QComboBox, QCheckBox, QPushButton,
-    QLabel, QFileDialog, QTableWidget, QTableWidgetItem,
+    QLabel, QTableWidget, QTableWidgetItem, QTableView,
     QDialogButtonBox, QTabWidget, QWidget, QMessageBox,
-    QHeaderView, QColorDialog, QFontComboBox, QGridLayout, QApplication
+    QHeaderView, QFontComboBox, QApplication, QStyledItemDelegate
+)
+# QColorDialog and QFileDialog are imported at call sites — they have
+# heavy initializers and are only needed when the user actually picks
+# a color or browses for a file
+from PyQt5.QtGui import QColor, QFont, QPalette
+from PyQt5.QtCore import (
+    Qt, QEvent, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool,
+    pyqtSignal, QAbstractTableModel, QModelIndex, QRect
 )
-from PyQt5.QtGui import QColor, QFont
-from PyQt5.QtCore import Qt
 
 from .models import (
     Connection, Folder, SSHConfig, SerialConfig,
     AppSettings, DEFAULT_TERMINAL_SETTINGS, DEFAULT_LOGGING_SETTINGS
 )
-from .sessions import list_serial_ports
 
+# .sessions (paramiko/pyserial) is deliberately not imported here:
+# cached_serial_ports is pulled in at its call sites so importing the
+# dialogs — and therefore the package — doesn't load the crypto stack.
 
 # Security presets
 SECURITY_PRESETS = {
@@ -35,11 +43,37 @@ SECURITY_PRESETS = {
     "Custom": None,
 }
 
+def _preset_display(val: str) -> tuple:
+    """(short text, tooltip) shown for one preset algorithm list"""
+    if not val:
+        return ("(system defaults)",
+                "Using paramiko defaults — strongest available algorithms")
+    parts = val.split(",")
+    short = ", ".join(parts[:3])
+    if len(parts) > 3:
+        short += f"  (+{len(parts) - 3} more)"
+    return (short, val.replace(",", ",  "))
+
+
+# Presets are constants, so the display strings shown in the read-only
+# algorithm fields are computed once at import time.
+SECURITY_PRESETS_DISPLAY = {
+    name: {key: _preset_display(val) for key, val in preset.items()}
+    for name, preset in SECURITY_PRESETS.items()
+    if preset is not None
+}
+
 # Parity / stopbits / flow maps for serial config
 PARITY_CODES = ["N", "E", "O", "M", "S"]
 STOPBITS_VALS = [1.0, 1.5, 2.0]
 FLOW_VALS = ["none", "xonxoff", "rtscts"]
 
+# Inverse lookups (value -> combo index), derived so the lists above stay
+# the single source of truth
+PARITY_INDEX = {c: i for i, c in enumerate(PARITY_CODES)}
+STOPBITS_INDEX = {v: i for i, v in enumerate(STOPBITS_VALS)}
+FLOW_INDEX = {v: i for i, v in enumerate(FLOW_VALS)}
+
 
 def _make_dialog_buttons(parent, on_ok, on_cancel):
     """Create OK/Cancel buttons WITHOUT Qt standard icons (fixes rendering on Arch/Wayland)"""
@@ -61,11 +95,80 @@ def _make_dialog_buttons(parent, on_ok, on_cancel):
     return layout
 
 
+# Item models for the serial tab combos, shared by every ConnectionDialog
+# so repeat opens don't re-create the same constant item lists
+_combo_models = None
+
+
+def _get_combo_models():
+    global _combo_models
+    if _combo_models is None:
+        from PyQt5.QtGui import QStandardItemModel, QStandardItem
+
+        def model(items):
+            m = QStandardItemModel()
+            for text in items:
+                m.appendRow(QStandardItem(text))
+            return m
+
+        _combo_models = {
+            'baud': model(["300", "1200", "2400", "4800", "9600",
+                           "19200", "38400", "57600", "115200"]),
+            'databits': model(["5", "6", "7", "8"]),
+            'parity': model(["None", "Even", "Odd", "Mark", "Space"]),
+            'stopbits': model(["1", "1.5", "2"]),
+            'flow': model(["None", "XON/XOFF", "RTS/CTS"]),
+        }
+    return _combo_models
+
+
+class _PortScanSignals(QObject):
+    finished = pyqtSignal(list)
+
+
+class _PortScanTask(QRunnable):
+    """Enumerates serial ports off the GUI thread"""
+
+    def __init__(self, refresh=False):
+        super().__init__()
+        self.signals = _PortScanSignals()
+        self._refresh = refresh
+
+    def run(self):
+        try:
+            from .sessions import cached_serial_ports
+            ports = cached_serial_ports(refresh=self._refresh)
+        except Exception:
+            ports = []
+        self.signals.finished.emit(ports)
+
+
+# Monospace font model, built once on first use and shared by every
+# TerminalSettingsWidget. The hidden QFontComboBox is kept alive because
+# it owns the model.
+_font_model_source = None
+
+
+def _get_font_model():
+    global _font_model_source
+    if _font_model_source is None:
+        _font_model_source = QFontComboBox()
+        _font_model_source.setFontFilters(QFontComboBox.MonospacedFonts)
+    return _font_model_source.model()
+
+
 # --- Shared terminal settings widget builder ---
 
 class TerminalSettingsWidget(QWidget):
     """Reusable widget for terminal color/font/highlight settings"""
 
+    # (label, default color, attribute prefix) for the color grid
+    _COLOR_ROWS = [
+        ("Background:", "#1e1e2e", "bg"),
+        ("Text:", "#cdd6f4", "fg"),
+        ("Cursor:", "#f5e0dc", "cursor"),
+    ]
+
     def __init__(self, border_color="#45475a", accent_color="#89b4fa",
                  hint_color="#6c7086", parent=None):
         super().__init__(parent)
@@ -78,32 +181,43 @@ class TerminalSettingsWidget(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(8)
+        self._preview_pending = set()
 
         # Colors
         colors_label = QLabel("Colors")
-        colors_label.setStyleSheet(f"font-weight: bold; color: {self._accent_color};")
+        colors_label.setObjectName("sectionHeader")
         layout.addWidget(colors_label)
 
-        grid = QGridLayout()
-        grid.setSpacing(6)
-        grid.setColumnStretch(1, 2)
-        grid.setColumnStretch(2, 1)
-        grid.setColumnMinimumWidth(1, 120)
-
-        self.bg_edit, self.bg_preview = self._add_color_row(grid, 0, "Background:", "#1e1e2e")
-        self.fg_edit, self.fg_preview = self._add_color_row(grid, 1, "Text:", "#cdd6f4")
-        self.cursor_edit, self.cursor_preview = self._add_color_row(grid, 2, "Cursor:", "#f5e0dc")
-        layout.addLayout(grid)
+        # A form layout with one composite widget per row keeps the layout
+        # tree small compared to a hand-tuned 4-column grid
+        colors_form = QFormLayout()
+        colors_form.setSpacing(6)
+
+        self._swatch_qss = f"border: 1px solid {self._border_color}; border-radius: 4px;"
+        self._color_edits = {}
+        self._swatch_of = {}
+        for label_text, default_color, key in self._COLOR_ROWS:
+            edit, preview = self._add_color_row(colors_form, label_text, default_color)
+            self._color_edits[key] = (edit, preview)
+            setattr(self, f"{key}_edit", edit)
+            setattr(self, f"{key}_preview", preview)
+        layout.addLayout(colors_form)
 
         # Font
         font_label = QLabel("Font")
-        font_label.setStyleSheet(f"font-weight: bold; color: {self._accent_color};")
+        font_label.setObjectName("sectionHeader")
         layout.addWidget(font_label)
 
         font_form = QFormLayout()
         font_form.setSpacing(6)
-        self.font_family = QFontComboBox()
-        self.font_family.setFontFilters(QFontComboBox.MonospacedFonts)
+        # QFontComboBox scans every installed font at construction, which
+        # dominates this widget's build time. Start with a plain editable
+        # combo and fill in the full monospace list on first interaction.
+        self.font_family = QComboBox()
+        self.font_family.setEditable(True)
+        self.font_family.addItem("monospace")
+        self.font_family.installEventFilter(self)
+        self._font_combo_filled = False
         font_form.addRow("Family:", self.font_family)
         self.font_size = QSpinBox()
         self.font_size.setRange(6, 32)
@@ -113,50 +227,111 @@ class TerminalSettingsWidget(QWidget):
 
         # Syntax highlighting
         hl_label = QLabel("Syntax Highlighting")
-        hl_label.setStyleSheet(f"font-weight: bold; color: {self._accent_color};")
+        hl_label.setObjectName("sectionHeader")
         layout.addWidget(hl_label)
         self.syntax_enabled = QCheckBox("Enable command syntax highlighting")
         self.syntax_enabled.setChecked(True)
         layout.addWidget(self.syntax_enabled)
         hint = QLabel("Highlights network commands: show, interface, ip, vlan, configure, etc.")
-        hint.setStyleSheet(f"color: {self._hint_color}; font-size: 11px;")
+        hint.setObjectName("hint")
         layout.addWidget(hint)
 
         layout.addStretch()
 
-    def _add_color_row(self, grid, row, label_text, default_color):
-        grid.addWidget(QLabel(label_text), row, 0)
+    def _add_color_row(self, form, label_text, default_color):
+        row = QWidget()
+        hl = QHBoxLayout(row)
+        hl.setContentsMargins(0, 0, 0, 0)
+        hl.setSpacing(6)
 
         edit = QLineEdit(default_color)
         edit.setMinimumWidth(100)
-        grid.addWidget(edit, row, 1)
+        edit._cached_color = QColor(default_color)
+        hl.addWidget(edit, 1)
 
         btn = QPushButton("Choose")
         btn.setMinimumWidth(70)
-        btn.clicked.connect(lambda: self._choose_color(edit))
-        grid.addWidget(btn, row, 2)
+        btn.setProperty("target_edit", edit)
+        btn.clicked.connect(self._choose_color_clicked)
+        hl.addWidget(btn)
 
         preview = QLabel()
         preview.setFixedSize(24, 24)
-        preview.setStyleSheet(f"border: 1px solid {self._border_color}; border-radius: 4px;")
-        grid.addWidget(preview, row, 3, Qt.AlignLeft)
-
-        edit.textChanged.connect(lambda: self._update_preview(edit, preview))
+        # Border/radius set once; the swatch color itself is updated via
+        # QPalette so keystrokes don't re-run Qt's stylesheet parser
+        preview.setStyleSheet(self._swatch_qss)
+        preview.setAutoFillBackground(True)
+        hl.addWidget(preview)
+
+        form.addRow(label_text, row)
+
+        # Bound-method slots with sender() dispatch instead of one lambda
+        # closure per row
+        self._swatch_of[edit] = preview
+        edit.textChanged.connect(self._on_color_text_changed)
         return edit, preview
 
+    def _choose_color_clicked(self):
+        self._choose_color(self.sender().property("target_edit"))
+
+    def _on_color_text_changed(self):
+        edit = self.sender()
+        self._schedule_preview(edit, self._swatch_of[edit])
+
+    def _schedule_preview(self, edit: QLineEdit, preview: QLabel):
+        """Coalesce textChanged bursts (paste, fast typing) into one repaint"""
+        if edit in self._preview_pending:
+            return
+        self._preview_pending.add(edit)
+        QTimer.singleShot(30, lambda: self._flush_preview(edit, preview))
+
+    def _flush_preview(self, edit: QLineEdit, preview: QLabel):
+        self._preview_pending.discard(edit)
+        self._update_preview(edit, preview)
+
+    def eventFilter(self, obj, event):
+        if obj is self.font_family and event.type() in (QEvent.FocusIn, QEvent.MouseButtonPress):
+            self._fill_font_combo()
+        return super().eventFilter(obj, event)
+
+    def _fill_font_combo(self):
+        """Swap in the full monospace font list on first use"""
+        if self._font_combo_filled:
+            return
+        self._font_combo_filled = True
+        current = self.font_family.currentText()
+        self.font_family.setModel(_get_font_model())
+        self.font_family.setCurrentText(current)
+
     def _choose_color(self, edit: QLineEdit):
-        color = QColorDialog.getColor(QColor(edit.text()), self, "Choose Color")
+        from PyQt5.QtWidgets import QColorDialog
+        color = QColorDialog.getColor(edit._cached_color, self, "Choose Color")
         if color.isValid():
             edit.setText(color.name())
 
     def _update_preview(self, edit: QLineEdit, preview: QLabel):
-        c = edit.text()
-        if QColor(c).isValid():
-            preview.setStyleSheet(
-                f"background-color: {c}; border: 1px solid {self._border_color}; border-radius: 4px;"
-            )
+        # Reuse the per-edit QColor instead of constructing one per update
+        color = edit._cached_color
+        color.setNamedColor(edit.text())
+        if not color.isValid():
+            return
+        pal = preview.palette()
+        pal.setColor(QPalette.Window, color)
+        preview.setPalette(pal)
 
     def load_settings(self, cfg: dict):
+        # Compare against what the edits show right now — not the last
+        # loaded values — so a load that reverts user typing (e.g.
+        # Reset to Defaults) still repaints the swatches
+        unchanged = (
+            self.bg_edit.text() == cfg.get('bg_color', '#1e1e2e')
+            and self.fg_edit.text() == cfg.get('fg_color', '#cdd6f4')
+            and self.cursor_edit.text() == cfg.get('cursor_color', '#f5e0dc')
+        )
+        # Block per-field preview updates during the bulk load; one
+        # update_all_previews() at the end repaints everything
+        blockers = [QSignalBlocker(w) for w in
+                    (self.bg_edit, self.fg_edit, self.cursor_edit)]
         self.bg_edit.setText(cfg.get('bg_color', '#1e1e2e'))
         self.fg_edit.setText(cfg.get('fg_color', '#cdd6f4'))
         self.cursor_edit.setText(cfg.get('cursor_color', '#f5e0dc'))
@@ -164,23 +339,25 @@ class TerminalSettingsWidget(QWidget):
         self.syntax_enabled.setChecked(cfg.get('syntax_highlight', True))
         family = cfg.get('font_family', '')
         if family:
-            self.font_family.setCurrentFont(QFont(family))
-        self.update_all_previews()
+            self.font_family.setCurrentText(family)
+        del blockers
+        # Re-opening with the same colors (e.g. cancel + edit again) skips
+        # the preview repaints entirely
+        if not unchanged:
+            self.update_all_previews()
 
     def get_settings(self) -> dict:
         return {
             'bg_color': self.bg_edit.text(),
             'fg_color': self.fg_edit.text(),
             'cursor_color': self.cursor_edit.text(),
-            'font_family': self.font_family.currentFont().family(),
+            'font_family': self.font_family.currentText(),
             'font_size': self.font_size.value(),
             'syntax_highlight': self.syntax_enabled.isChecked(),
         }
 
     def update_all_previews(self):
-        for edit, preview in [(self.bg_edit, self.bg_preview),
-                              (self.fg_edit, self.fg_preview),
-                              (self.cursor_edit, self.cursor_preview)]:
+        for edit, preview in self._color_edits.values():
             self._update_preview(edit, preview)
 
     def reset_defaults(self):
@@ -196,6 +373,7 @@ class ConnectionDialog(QDialog):
         super().__init__(parent)
         self.connection = connection or Connection()
         self.is_new = connection is None
+        self._last_preset = None
 
         self.setWindowTitle("New Connection" if self.is_new else "Edit Connection")
         self.setMinimumSize(520, 420)
@@ -223,19 +401,41 @@ class ConnectionDialog(QDialog):
         type_row.addStretch()
         layout.addLayout(type_row)
 
-        # Tabs
+        # Tabs — built lazily on first activation. Widget construction dominates
+        # dialog open time, so only the initially visible tab is populated;
+        # the heavy TerminalSettingsWidget is built only if the user opens it.
         self.tabs = QTabWidget()
-        self._build_ssh_tab()
-        self._build_security_tab()
-        self._build_serial_tab()
-        self._build_terminal_tab()
+        self._tab_built = set()
+        self._tab_builders = {
+            0: self._build_ssh_tab,
+            1: self._build_security_tab,
+            2: self._build_serial_tab,
+            3: self._build_terminal_tab,
+        }
+        self._tab_loaders = {
+            0: self._load_ssh_tab,
+            1: self._load_security_tab,
+            2: self._load_serial_tab,
+            3: self._load_terminal_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        for title in ("SSH", "Security", "Serial", "Terminal"):
+            self.tabs.addTab(QWidget(), title)
         layout.addWidget(self.tabs)
 
         # Buttons (no icons)
         layout.addLayout(_make_dialog_buttons(self, self._save_and_accept, self.reject))
 
-    def _build_ssh_tab(self):
-        w = QWidget()
+    def _ensure_tab(self, index):
+        """Populate a placeholder tab on first activation"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self._tab_built.add(index)
+        builder(self.tabs.widget(index))
+        self._tab_loaders[index]()
+
+    def _build_ssh_tab(self, w):
         form = QFormLayout(w)
         self.ssh_host = QLineEdit()
         self.ssh_host.setPlaceholderText("192.168.1.1 or hostname")
@@ -262,16 +462,13 @@ class ConnectionDialog(QDialog):
         key_row.addWidget(browse_btn)
         form.addRow("Key File:", key_row)
 
-        self.tabs.addTab(w, "SSH")
-
-    def _build_security_tab(self):
-        w = QWidget()
+    def _build_security_tab(self, w):
         layout = QVBoxLayout(w)
         layout.setSpacing(4)
         layout.setContentsMargins(12, 8, 12, 8)
 
         preset_label = QLabel("Security Preset")
-        preset_label.setStyleSheet("font-weight: bold; color: #89b4fa;")
+        preset_label.setObjectName("sectionHeader")
         layout.addWidget(preset_label)
 
         self.security_preset = QComboBox()
@@ -282,38 +479,36 @@ class ConnectionDialog(QDialog):
             "Modern: secure only · Compatible: most devices · "
             "Legacy: old Cisco/Huawei · Custom: manual"
         )
-        hint.setStyleSheet("color: #6c7086; font-size: 10px;")
+        hint.setObjectName("hint")
         hint.setWordWrap(True)
         layout.addWidget(hint)
 
         layout.addSpacing(2)
 
-        # Algorithm fields
-        self._algo_fields = {}
+        # Algorithm fields, allocated in one pass
         algo_defs = [
             ("ciphers", "Ciphers", "e.g. aes128-ctr,aes256-ctr"),
             ("kex", "Key Exchange", "e.g. diffie-hellman-group14-sha1"),
             ("hostkeys", "Host Key Algs", "e.g. ssh-rsa,ssh-ed25519"),
             ("macs", "MAC Algs", "e.g. hmac-sha2-256,hmac-sha1"),
         ]
-        for name, label_text, placeholder in algo_defs:
+        edits = [QLineEdit() for _ in algo_defs]
+        for edit, (name, label_text, placeholder) in zip(edits, algo_defs):
+            edit.setObjectName(f"algo_{name}")
+            edit.setPlaceholderText(placeholder)
             lbl = QLabel(label_text)
-            lbl.setStyleSheet("font-weight: bold; color: #89b4fa; margin-top: 2px;")
+            lbl.setObjectName("sectionHeader")
             layout.addWidget(lbl)
-            edit = QLineEdit()
-            edit.setPlaceholderText(placeholder)
             layout.addWidget(edit)
-            self._algo_fields[name] = edit
+        self._algo_fields = dict(zip((name for name, _, _ in algo_defs), edits))
 
         layout.addStretch()
-        self.tabs.addTab(w, "Security")
 
         # Connect and trigger initial state
         self.security_preset.currentTextChanged.connect(self._on_security_preset_changed)
         self._on_security_preset_changed(self.security_preset.currentText())
 
-    def _build_serial_tab(self):
-        w = QWidget()
+    def _build_serial_tab(self, w):
         form = QFormLayout(w)
 
         port_row = QHBoxLayout()
@@ -322,38 +517,39 @@ class ConnectionDialog(QDialog):
         self._refresh_serial_ports()
         port_row.addWidget(self.serial_port)
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self._refresh_serial_ports)
+        refresh_btn.clicked.connect(lambda: self._refresh_serial_ports(force=True))
         port_row.addWidget(refresh_btn)
         form.addRow("Port:", port_row)
 
+        models = _get_combo_models()
+
         self.serial_baud = QComboBox()
-        self.serial_baud.addItems(["300", "1200", "2400", "4800", "9600",
-                                   "19200", "38400", "57600", "115200"])
+        self.serial_baud.setModel(models['baud'])
         self.serial_baud.setCurrentText("9600")
         form.addRow("Baud Rate:", self.serial_baud)
 
         self.serial_databits = QComboBox()
-        self.serial_databits.addItems(["5", "6", "7", "8"])
+        self.serial_databits.setModel(models['databits'])
         self.serial_databits.setCurrentText("8")
         form.addRow("Data Bits:", self.serial_databits)
 
         self.serial_parity = QComboBox()
-        self.serial_parity.addItems(["None", "Even", "Odd", "Mark", "Space"])
+        self.serial_parity.setModel(models['parity'])
         form.addRow("Parity:", self.serial_parity)
 
         self.serial_stopbits = QComboBox()
-        self.serial_stopbits.addItems(["1", "1.5", "2"])
+        self.serial_stopbits.setModel(models['stopbits'])
         form.addRow("Stop Bits:", self.serial_stopbits)
 
         self.serial_flow = QComboBox()
-        self.serial_flow.addItems(["None", "XON/XOFF", "RTS/CTS"])
+        self.serial_flow.setModel(models['flow'])
         form.addRow("Flow Control:", self.serial_flow)
 
-        self.tabs.addTab(w, "Serial")
-
-    def _build_terminal_tab(self):
+    def _build_terminal_tab(self, w):
+        layout = QVBoxLayout(w)
+        layout.setContentsMargins(0, 0, 0, 0)
         self.term_widget = TerminalSettingsWidget()
-        self.tabs.addTab(self.term_widget, "Terminal")
+        layout.addWidget(self.term_widget)
 
     # --- Actions ---
 
@@ -361,6 +557,11 @@ class ConnectionDialog(QDialog):
         self.tabs.setCurrentIndex(0 if index == 0 else 2)
 
     def _on_security_preset_changed(self, preset_name):
+        # Fired both from the combo signal and explicitly after loads;
+        # ignore repeats for the preset already applied
+        if preset_name == self._last_preset:
+            return
+        self._last_preset = preset_name
         preset = SECURITY_PRESETS.get(preset_name)
         is_custom = preset is None
 
@@ -372,31 +573,31 @@ class ConnectionDialog(QDialog):
                 if not edit.text() or edit.text() == "(system defaults)":
                     edit.clear()
         else:
+            display = SECURITY_PRESETS_DISPLAY[preset_name]
             for key, edit in self._algo_fields.items():
-                val = preset[key]
-                if val:
-                    # Show readable text, tooltip has full list
-                    parts = val.split(",")
-                    short = ", ".join(parts[:3])
-                    if len(parts) > 3:
-                        short += f"  (+{len(parts) - 3} more)"
-                    edit.setText(short)
-                    edit.setToolTip(val.replace(",", ",  "))
-                else:
-                    edit.setText("(system defaults)")
-                    edit.setToolTip("Using paramiko defaults — strongest available algorithms")
+                short, tip = display[key]
+                edit.setText(short)
+                edit.setToolTip(tip)
                 edit.setReadOnly(True)
                 edit.setFocusPolicy(Qt.NoFocus)
 
     def _browse_keyfile(self):
+        from PyQt5.QtWidgets import QFileDialog
         path, _ = QFileDialog.getOpenFileName(self, "Select Private Key", "", "All Files (*)")
         if path:
             self.ssh_keyfile.setText(path)
 
-    def _refresh_serial_ports(self):
+    def _refresh_serial_ports(self, force=False):
+        # Scan off the GUI thread so building the Serial tab doesn't block
+        # on /sys + udev probing; the combo fills in when the scan lands
+        self._port_scan = _PortScanTask(refresh=force)
+        self._port_scan.signals.finished.connect(self._populate_serial_ports)
+        QThreadPool.globalInstance().start(self._port_scan)
+
+    def _populate_serial_ports(self, ports):
         current = self.serial_port.currentText()
         self.serial_port.clear()
-        for port in list_serial_ports():
+        for port in ports:
             self.serial_port.addItem(f"{port['device']} - {port['description']}", port['device'])
         if current:
             idx = self.serial_port.findData(current)
@@ -415,7 +616,11 @@ class ConnectionDialog(QDialog):
             self.type_combo.setCurrentIndex(0)
             self.tabs.setCurrentIndex(0)
 
-        # SSH
+        # Tab contents are loaded by _ensure_tab as each tab is built;
+        # make sure the initially visible one is populated now.
+        self._ensure_tab(self.tabs.currentIndex())
+
+    def _load_ssh_tab(self):
         ssh = self.connection.get_ssh_config()
         self.ssh_host.setText(ssh.host)
         self.ssh_port.setValue(ssh.port)
@@ -423,20 +628,29 @@ class ConnectionDialog(QDialog):
         self.ssh_password.setText(ssh.password)
         self.ssh_keyfile.setText(ssh.key_file)
 
-        # Security
+    def _load_security_tab(self):
         ssh_cfg = self.connection.ssh_config or {}
+        # Block the preset's currentTextChanged while loading, then apply
+        # the handler exactly once for the final preset
+        blocker = QSignalBlocker(self.security_preset)
         for key in ('ciphers', 'kex', 'hostkeys', 'macs'):
             self._algo_fields[key].setText(ssh_cfg.get(key, ''))
         preset = ssh_cfg.get('security_preset', 'Modern (default)')
         idx = self.security_preset.findText(preset)
         if idx >= 0:
             self.security_preset.setCurrentIndex(idx)
+        del blocker
+        # The field-overwrite above invalidated whatever the handler
+        # last applied; drop the repeat-guard so it re-renders even if
+        # the preset name happens to match (the common Modern default)
+        self._last_preset = None
+        self._on_security_preset_changed(self.security_preset.currentText())
 
-        # Terminal
-        term_cfg = ssh_cfg.get('terminal', {})
-        self.term_widget.load_settings(term_cfg)
+    def _load_terminal_tab(self):
+        ssh_cfg = self.connection.ssh_config or {}
+        self.term_widget.load_settings(ssh_cfg.get('terminal', {}))
 
-        # Serial
+    def _load_serial_tab(self):
         ser = self.connection.get_serial_config()
         if ser.port:
             idx = self.serial_port.findData(ser.port)
@@ -446,9 +660,9 @@ class ConnectionDialog(QDialog):
                 self.serial_port.setEditText(ser.port)
         self.serial_baud.setCurrentText(str(ser.baudrate))
         self.serial_databits.setCurrentText(str(ser.bytesize))
-        self.serial_parity.setCurrentIndex({"N": 0, "E": 1, "O": 2, "M": 3, "S": 4}.get(ser.parity, 0))
-        self.serial_stopbits.setCurrentIndex({1.0: 0, 1.5: 1, 2.0: 2}.get(ser.stopbits, 0))
-        self.serial_flow.setCurrentIndex({"none": 0, "xonxoff": 1, "rtscts": 2}.get(ser.flow_control, 0))
+        self.serial_parity.setCurrentIndex(PARITY_INDEX.get(ser.parity, 0))
+        self.serial_stopbits.setCurrentIndex(STOPBITS_INDEX.get(ser.stopbits, 0))
+        self.serial_flow.setCurrentIndex(FLOW_INDEX.get(ser.flow_control, 0))
 
     def _save_and_accept(self):
         name = self.name_edit.text().strip()
@@ -468,31 +682,38 @@ class ConnectionDialog(QDialog):
             val = self._algo_fields[key].text().strip()
             return "" if val.startswith("(") else val
 
-        # SSH config
-        self.connection.ssh_config = {
-            "host": self.ssh_host.text(),
-            "port": self.ssh_port.value(),
-            "username": self.ssh_username.text(),
-            "password": self.ssh_password.text(),
-            "key_file": self.ssh_keyfile.text(),
-            "security_preset": self.security_preset.currentText(),
-            "ciphers": _algo_val("ciphers"),
-            "kex": _algo_val("kex"),
-            "hostkeys": _algo_val("hostkeys"),
-            "macs": _algo_val("macs"),
-            "terminal": self.term_widget.get_settings(),
-        }
-
-        # Serial config
-        port = self.serial_port.currentData() or self.serial_port.currentText().split(" - ")[0]
-        self.connection.serial_config = {
-            "port": port,
-            "baudrate": int(self.serial_baud.currentText()),
-            "bytesize": int(self.serial_databits.currentText()),
-            "parity": PARITY_CODES[self.serial_parity.currentIndex()],
-            "stopbits": STOPBITS_VALS[self.serial_stopbits.currentIndex()],
-            "flow_control": FLOW_VALS[self.serial_flow.currentIndex()],
-        }
+        # Tabs that were never built keep the connection's existing values
+        ssh_cfg = dict(self.connection.ssh_config or {})
+        if 0 in self._tab_built:
+            ssh_cfg.update({
+                "host": self.ssh_host.text(),
+                "port": self.ssh_port.value(),
+                "username": self.ssh_username.text(),
+                "password": self.ssh_password.text(),
+                "key_file": self.ssh_keyfile.text(),
+            })
+        if 1 in self._tab_built:
+            ssh_cfg.update({
+                "security_preset": self.security_preset.currentText(),
+                "ciphers": _algo_val("ciphers"),
+                "kex": _algo_val("kex"),
+                "hostkeys": _algo_val("hostkeys"),
+                "macs": _algo_val("macs"),
+            })
+        if 3 in self._tab_built:
+            ssh_cfg["terminal"] = self.term_widget.get_settings()
+        self.connection.ssh_config = ssh_cfg
+
+        if 2 in self._tab_built:
+            port = self.serial_port.currentData() or self.serial_port.currentText().split(" - ")[0]
+            self.connection.serial_config = {
+                "port": port,
+                "baudrate": int(self.serial_baud.currentText()),
+                "bytesize": int(self.serial_databits.currentText()),
+                "parity": PARITY_CODES[self.serial_parity.currentIndex()],
+                "stopbits": STOPBITS_VALS[self.serial_stopbits.currentIndex()],
+                "flow_control": FLOW_VALS[self.serial_flow.currentIndex()],
+            }
 
         self.accept()
 
@@ -551,7 +772,7 @@ class SerialPortsDialog(QDialog):
 
         btn_row = QHBoxLayout()
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self._refresh)
+        refresh_btn.clicked.connect(lambda: self._refresh(force=True))
         btn_row.addWidget(refresh_btn)
         btn_row.addStretch()
         close_btn = QPushButton("Close")
@@ -561,14 +782,20 @@ class SerialPortsDialog(QDialog):
 
         self._refresh()
 
-    def _refresh(self):
-        self.table.setRowCount(0)
-        for port in list_serial_ports():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+    def _refresh(self, force=False):
+        from .sessions import cached_serial_ports
+        ports = cached_serial_ports(refresh=force)
+        # Preallocate rows with updates and signals off so the table
+        # repaints once and emits nothing per cell
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(ports))
+        for row, port in enumerate(ports):
             self.table.setItem(row, 0, QTableWidgetItem(port['device']))
             self.table.setItem(row, 1, QTableWidgetItem(port['description']))
             self.table.setItem(row, 2, QTableWidgetItem(port['hwid']))
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
 
 
 class SettingsDialog(QDialog):
@@ -606,7 +833,7 @@ class SettingsDialog(QDialog):
         self.theme_light.toggled.connect(lambda on: self.theme_dark.setChecked(not on) if on else None)
 
         hint = QLabel("Note: Theme changes take effect after restart.")
-        hint.setStyleSheet("color: gray; font-style: italic;")
+        hint.setObjectName("hint")
         theme_layout.addWidget(hint)
         app_layout.addWidget(theme_group)
         app_layout.addStretch()
@@ -641,7 +868,7 @@ class SettingsDialog(QDialog):
         self.log_enabled.toggled.connect(self._on_logging_toggled)
         enable_gl.addWidget(self.log_enabled)
         log_hint = QLabel("When enabled, all terminal output will be saved to log files.")
-        log_hint.setStyleSheet("color: gray; font-style: italic;")
+        log_hint.setObjectName("hint")
         enable_gl.addWidget(log_hint)
         log_layout.addWidget(enable_group)
 
@@ -656,7 +883,7 @@ class SettingsDialog(QDialog):
         dir_row.addWidget(browse_btn)
         dir_gl.addLayout(dir_row)
         dir_hint = QLabel("Leave empty to use default location.")
-        dir_hint.setStyleSheet("color: gray; font-style: italic;")
+        dir_hint.setObjectName("hint")
         dir_gl.addWidget(dir_hint)
         log_layout.addWidget(dir_group)
 
@@ -666,7 +893,7 @@ class SettingsDialog(QDialog):
         self.log_include_date.setChecked(True)
         fmt_gl.addWidget(self.log_include_date)
         fmt_hint = QLabel("Example: 2025-02-06_14-30-00_RouterCore1.log")
-        fmt_hint.setStyleSheet("color: gray; font-style: italic;")
+        fmt_hint.setObjectName("hint")
         fmt_gl.addWidget(fmt_hint)
         log_layout.addWidget(fmt_group)
 
@@ -710,6 +937,7 @@ class SettingsDialog(QDialog):
         self.log_include_date.setEnabled(enabled)
 
     def _browse_log_dir(self):
+        from PyQt5.QtWidgets import QFileDialog
         path = QFileDialog.getExistingDirectory(
             self, "Select Log Directory", self.log_dir_edit.text() or ""
         )
@@ -739,19 +967,127 @@ class SettingsDialog(QDialog):
         return self.settings.theme != self.original_theme
 
 
+class PasswordsModel(QAbstractTableModel):
+    """Table model for saved passwords — rows are plain data, no widgets"""
+
+    HEADERS = ["Name", "Host", "Username", "Password", "Actions"]
+    MASK = "\u2022" * 8
+
+    def __init__(self, connections: list, parent=None):
+        super().__init__(parent)
+        # [conn_id, name, host, username, password, hidden]
+        self.rows = []
+        # Lowercased "name\thost\tusername" per row so filtering is one
+        # substring scan instead of per-cell lowercasing on each keystroke
+        self._search_index = []
+        for conn in connections:
+            if conn.conn_type != "ssh":
+                continue
+            ssh_cfg = conn.ssh_config or {}
+            password = ssh_cfg.get("password", "")
+            if password:
+                name = conn.name
+                host = ssh_cfg.get("host", "")
+                username = ssh_cfg.get("username", "")
+                self.rows.append([conn.id, name, host, username, password, True])
+                self._search_index.append(f"{name}\t{host}\t{username}".lower())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = self.rows[index.row()]
+        col = index.column()
+        if col < 3:
+            return row[1 + col]
+        if col == 3:
+            return self.MASK if row[5] else row[4]
+        return None
+
+    def name(self, row: int) -> str:
+        return self.rows[row][1]
+
+    def password(self, row: int) -> str:
+        return self.rows[row][4]
+
+    def is_hidden(self, row: int) -> bool:
+        return self.rows[row][5]
+
+    def toggle_hidden(self, row: int):
+        self.rows[row][5] = not self.rows[row][5]
+        idx = self.index(row, 3)
+        self.dataChanged.emit(idx, idx)
+        # Actions column repaints its Show/Hide label
+        idx = self.index(row, 4)
+        self.dataChanged.emit(idx, idx)
+
+    def matches(self, row: int, text: str) -> bool:
+        return text in self._search_index[row]
+
+
+class PasswordActionsDelegate(QStyledItemDelegate):
+    """Paints Show/Copy buttons in the Actions column without per-row widgets"""
+
+    show_clicked = pyqtSignal(int)
+    copy_clicked = pyqtSignal(int)
+
+    PAD = 4
+
+    def _button_rects(self, rect):
+        w = (rect.width() - 3 * self.PAD) // 2
+        h = rect.height() - 2 * self.PAD
+        show_rect = QRect(rect.x() + self.PAD, rect.y() + self.PAD, w, h)
+        copy_rect = QRect(show_rect.right() + self.PAD, rect.y() + self.PAD, w, h)
+        return show_rect, copy_rect
+
+    def paint(self, painter, option, index):
+        from PyQt5.QtWidgets import QStyle, QStyleOptionButton
+        show_rect, copy_rect = self._button_rects(option.rect)
+        show_text = "Show" if index.model().is_hidden(index.row()) else "Hide"
+        style = QApplication.style()
+        for rect, text in ((show_rect, show_text), (copy_rect, "Copy")):
+            btn = QStyleOptionButton()
+            btn.rect = rect
+            btn.text = text
+            btn.state = QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, btn, painter)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease:
+            show_rect, copy_rect = self._button_rects(option.rect)
+            if show_rect.contains(event.pos()):
+                self.show_clicked.emit(index.row())
+                return True
+            if copy_rect.contains(event.pos()):
+                self.copy_clicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
 class PasswordManagerDialog(QDialog):
     """Dialog for viewing and managing saved passwords"""
 
     def __init__(self, connections: list, parent=None):
         super().__init__(parent)
         self.connections = connections
-        self.hidden_passwords = {}
+        self._clipboard = QApplication.clipboard()
 
         self.setWindowTitle("Password Manager")
         self.setMinimumSize(620, 350)
         self.setModal(True)
         self._setup_ui()
-        self._load_data()
+        self._last_query = ""
+        self._visible = set(range(self.model.rowCount()))
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -760,25 +1096,40 @@ class PasswordManagerDialog(QDialog):
         search_row.addWidget(QLabel("Search:"))
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Filter by name, host, or username...")
-        self.search_edit.textChanged.connect(self._filter_table)
+        # Debounce keystroke bursts — only the final query state is filtered
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(80)
+        self._filter_timer.timeout.connect(
+            lambda: self._filter_table(self.search_edit.text()))
+        self.search_edit.textChanged.connect(lambda _t: self._filter_timer.start())
         search_row.addWidget(self.search_edit)
         layout.addLayout(search_row)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Name", "Host", "Username", "Password", "Actions"])
-        header = self.table.horizontalHeader()
+        self.model = PasswordsModel(self.connections, self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        header = self.view.horizontalHeader()
+        # Column 4 is painted by the delegate, so ResizeToContents
+        # would size it to the header label; Fixed lets the explicit
+        # resizeSection below give the two buttons room
         for col, mode in [(0, QHeaderView.Stretch), (1, QHeaderView.Stretch),
                           (2, QHeaderView.ResizeToContents), (3, QHeaderView.Stretch),
-                          (4, QHeaderView.ResizeToContents)]:
+                          (4, QHeaderView.Fixed)]:
             header.setSectionResizeMode(col, mode)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.verticalHeader().setVisible(False)
-        layout.addWidget(self.table)
+        self.view.setSelectionBehavior(QTableView.SelectRows)
+        self.view.setEditTriggers(QTableView.NoEditTriggers)
+        self.view.verticalHeader().setVisible(False)
+
+        self.actions_delegate = PasswordActionsDelegate(self.view)
+        self.actions_delegate.show_clicked.connect(self._toggle_password)
+        self.actions_delegate.copy_clicked.connect(self._copy_password)
+        self.view.setItemDelegateForColumn(4, self.actions_delegate)
+        header.resizeSection(4, 140)
+        layout.addWidget(self.view)
 
         info = QLabel("Click 'Show' to reveal password, 'Copy' to copy to clipboard")
-        info.setStyleSheet("color: gray; font-style: italic;")
+        info.setObjectName("hint")
         layout.addWidget(info)
 
         btn_row = QHBoxLayout()
@@ -788,72 +1139,40 @@ class PasswordManagerDialog(QDialog):
         btn_row.addWidget(close_btn)
         layout.addLayout(btn_row)
 
-    def _load_data(self):
-        self.table.setRowCount(0)
-        for conn in self.connections:
-            if conn.conn_type != "ssh":
-                continue
-            ssh_cfg = conn.ssh_config or {}
-            password = ssh_cfg.get("password", "")
-            if not password:
-                continue
-
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.hidden_passwords[conn.id] = True
-
-            name_item = QTableWidgetItem(conn.name)
-            name_item.setData(Qt.UserRole, conn.id)
-            self.table.setItem(row, 0, name_item)
-            self.table.setItem(row, 1, QTableWidgetItem(ssh_cfg.get("host", "")))
-            self.table.setItem(row, 2, QTableWidgetItem(ssh_cfg.get("username", "")))
-
-            pwd_item = QTableWidgetItem("••••••••")
-            pwd_item.setData(Qt.UserRole, password)
-            self.table.setItem(row, 3, pwd_item)
-
-            actions = QWidget()
-            al = QHBoxLayout(actions)
-            al.setContentsMargins(4, 2, 4, 2)
-            al.setSpacing(4)
-
-            show_btn = QPushButton("Show")
-            show_btn.setMinimumWidth(60)
-            show_btn.clicked.connect(lambda _, r=row: self._toggle_password(r))
-            al.addWidget(show_btn)
-
-            copy_btn = QPushButton("Copy")
-            copy_btn.setMinimumWidth(60)
-            copy_btn.clicked.connect(lambda _, r=row: self._copy_password(r))
-            al.addWidget(copy_btn)
-
-            self.table.setCellWidget(row, 4, actions)
-
     def _toggle_password(self, row):
-        pwd_item = self.table.item(row, 3)
-        conn_id = self.table.item(row, 0).data(Qt.UserRole)
-        show_btn = self.table.cellWidget(row, 4).layout().itemAt(0).widget()
-
-        if self.hidden_passwords.get(conn_id, True):
-            pwd_item.setText(pwd_item.data(Qt.UserRole))
-            show_btn.setText("Hide")
-            self.hidden_passwords[conn_id] = False
-        else:
-            pwd_item.setText("••••••••")
-            show_btn.setText("Show")
-            self.hidden_passwords[conn_id] = True
+        self.model.toggle_hidden(row)
 
     def _copy_password(self, row):
-        password = self.table.item(row, 3).data(Qt.UserRole)
-        QApplication.clipboard().setText(password)
-        name = self.table.item(row, 0).text()
-        QMessageBox.information(self, "Copied", f"Password for '{name}' copied to clipboard.")
+        from PyQt5.QtWidgets import QToolTip
+        from PyQt5.QtGui import QCursor
+        self._clipboard.setText(self.model.password(row))
+        # A transient tooltip is far cheaper than a modal message box
+        QToolTip.showText(
+            QCursor.pos(),
+            f"Password for '{self.model.name(row)}' copied",
+            self.view, QRect(), 1200
+        )
 
     def _filter_table(self, text):
         text = text.lower()
-        for row in range(self.table.rowCount()):
-            show = any(
-                self.table.item(row, col) and text in self.table.item(row, col).text().lower()
-                for col in range(3)
-            )
-            self.table.setRowHidden(row, not show)
+        # Extending the query can only hide rows; shortening can only
+        # reveal them — so re-test just the affected side
+        if text.startswith(self._last_query):
+            for row in list(self._visible):
+                if not self.model.matches(row, text):
+                    self.view.setRowHidden(row, True)
+                    self._visible.discard(row)
+        elif self._last_query.startswith(text):
+            for row in range(self.model.rowCount()):
+                if row not in self._visible and self.model.matches(row, text):
+                    self.view.setRowHidden(row, False)
+                    self._visible.add(row)
+        else:
+            for row in range(self.model.rowCount()):
+                match = self.model.matches(row, text)
+                self.view.setRowHidden(row, not match)
+                if match:
+                    self._visible.add(row)
+                else:
+                    self._visible.discard(row)
+        self._last_query = text
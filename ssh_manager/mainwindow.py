@@ -1,6 +1,10 @@
 """Main window for SSH Manager"""
 
+import os
+import queue
 import re
+import threading
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Optional
 from pathlib import Path
@@ -9,10 +13,13 @@ from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QTreeWidget, QTreeWidgetItem, QTabWidget, QToolBar, QAction,
     QMenu, QMessageBox, QApplication, QStatusBar, QLabel, QAbstractItemView,
-    QProgressBar, QTabBar, QPushButton
+    QProgressBar, QTabBar, QPushButton, QTreeWidgetItemIterator
 )
 from PyQt5.QtGui import QKeySequence, QFont, QPixmap, QPainter, QPen, QColor, QIcon
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QMimeData, QThread
+from PyQt5.QtCore import (
+    Qt, QSize, pyqtSignal, QMimeData, QObject, QRunnable, QThread,
+    QThreadPool, QTimer
+)
 
 
 def _make_close_icon(color: str, size: int = 14) -> QIcon:
@@ -51,6 +58,10 @@ class CloseableTabBar(QTabBar):
     _icon_color = "#a6adc8"
     _icon_hover_color = "#1e1e2e"
 
+    # Close icons only depend on the icon color; paint each once and
+    # reuse it for every tab (QIcon assignment is ref-counted)
+    _icon_cache: Dict[str, QIcon] = {}
+
     @classmethod
     def set_theme(cls, theme: str):
         if theme == "light":
@@ -70,18 +81,21 @@ class CloseableTabBar(QTabBar):
         btn = QPushButton()
         btn.setFixedSize(20, 20)
         btn.setFlat(True)
-        btn.setIcon(_make_close_icon(self._icon_color))
+        icon = self._icon_cache.get(self._icon_color)
+        if icon is None:
+            icon = self._icon_cache.setdefault(self._icon_color, _make_close_icon(self._icon_color))
+        btn.setIcon(icon)
         btn.setIconSize(QSize(14, 14))
         btn.setStyleSheet(self._current_style)
-        btn.clicked.connect(self._on_close_clicked)
+        btn.clicked.connect(lambda _=False, b=btn: self._on_close_clicked(b))
         self.setTabButton(index, QTabBar.RightSide, btn)
 
-    def _on_close_clicked(self):
-        sender = self.sender()
-        for i in range(self.count()):
-            if self.tabButton(i, QTabBar.RightSide) == sender:
-                self.tabCloseRequested.emit(i)
-                return
+    def _on_close_clicked(self, btn):
+        # Resolve the button's current index from its position so the
+        # mapping stays correct after tabs are reordered — no per-tab scan
+        index = self.tabAt(btn.mapTo(self, btn.rect().center()))
+        if index >= 0:
+            self.tabCloseRequested.emit(index)
 
 
 class CloseableTabWidget(QTabWidget):
@@ -91,22 +105,58 @@ class CloseableTabWidget(QTabWidget):
 
 
 from .models import ConfigManager, Connection, Folder
-from .sessions import SSHSession, SerialSession
-from .terminal import TerminalWidget
-from .dialogs import (
-    ConnectionDialog, FolderDialog, SerialPortsDialog,
-    SettingsDialog, PasswordManagerDialog,
-)
+from .dialogs import ConnectionDialog, FolderDialog
+
+# .sessions (paramiko/pyserial) and .terminal (pyte) are imported at
+# first use — here and in the dialogs — so the main window can paint
+# before the crypto stack loads.
+
+
+class LogWriterThread(QThread):
+    """Drains queued log chunks to disk off the GUI thread.
+
+    The GUI thread only pays the cost of an enqueue; disk latency
+    (slow filesystems, encrypted volumes) never blocks terminal echo.
+    Writes go through os.write on a raw O_APPEND descriptor — chunks
+    are already batched upstream, so the buffered io layer would only
+    add a lock and a copy per call. A None sentinel shuts the worker
+    down.
+    """
+
+    def __init__(self, fd: int):
+        super().__init__()
+        self.fd = fd
+        self.queue = queue.Queue()
+
+    def run(self):
+        q = self.queue
+        while True:
+            data = q.get()
+            if data is None:
+                return
+            try:
+                os.write(self.fd, data)
+            except Exception:
+                pass
+
+    def stop(self):
+        self.queue.put(None)
+        self.wait(2000)
 
 
 class SessionLogger:
     """Handles logging of terminal session output to file"""
 
-    ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\x1b\].*?\x07|\x1b[PX^_].*?\x1b\\|\x1b.')
+    # Drain the accumulator to the file once it exceeds this many bytes;
+    # between drains the owning tab's timer calls flush() periodically
+    FLUSH_THRESHOLD = 32768
 
     def __init__(self, log_dir: Path, connection_name: str, include_date: bool = True):
-        self.log_file = None
+        self.fd = None
         self.log_path = None
+        self._writer = None
+        self._buf = []
+        self._buf_len = 0
 
         safe_name = re.sub(r'[^\w\-.]', '_', connection_name)
         ts = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
@@ -114,45 +164,115 @@ class SessionLogger:
         self.log_path = log_dir / filename
 
         try:
-            self.log_file = open(self.log_path, 'a', encoding='utf-8', errors='replace')
+            self.fd = os.open(str(self.log_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
             now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            self.log_file.write(f"=== Session started: {now} ===\n")
-            self.log_file.write(f"=== Connection: {connection_name} ===\n\n")
-            self.log_file.flush()
+            os.write(self.fd, f"=== Session started: {now} ===\n".encode())
+            os.write(self.fd, f"=== Connection: {connection_name} ===\n\n".encode())
+            self._writer = LogWriterThread(self.fd)
+            self._writer.start()
         except Exception as e:
             print(f"Failed to create log file: {e}")
-            self.log_file = None
+            self.fd = None
+
+    @staticmethod
+    def _strip_ansi(data: bytes) -> bytes:
+        """Remove ANSI escape sequences with a single linear scan.
+
+        Jumps between ESC bytes with bytes.find so plain-text spans are
+        copied in bulk, and walks each sequence (CSI, OSC, DCS/SOS/PM/APC
+        or a two-byte escape) forward once — no regex backtracking on
+        long OSC/DCS payloads.
+        """
+        i = data.find(b'\x1b')
+        if i < 0:
+            return data
+        out = bytearray(data[:i])
+        n = len(data)
+        find = data.find
+        while i < n:
+            i += 1
+            if i >= n:
+                break
+            c = data[i]
+            if c == 0x5b:  # CSI: params, then a final byte in @..~
+                i += 1
+                while i < n and not (0x40 <= data[i] <= 0x7e):
+                    i += 1
+                i += 1
+            elif c == 0x5d:  # OSC: runs to BEL or ESC \
+                i += 1
+                while i < n:
+                    b = data[i]
+                    if b == 0x07:
+                        i += 1
+                        break
+                    if b == 0x1b and i + 1 < n and data[i + 1] == 0x5c:
+                        i += 2
+                        break
+                    i += 1
+            elif c in (0x50, 0x58, 0x5e, 0x5f):  # DCS/SOS/PM/APC: to ESC \
+                i += 1
+                while i < n:
+                    if data[i] == 0x1b and i + 1 < n and data[i + 1] == 0x5c:
+                        i += 2
+                        break
+                    i += 1
+            else:  # two-byte escape (charset selection etc.)
+                i += 1
+            j = find(b'\x1b', i)
+            if j < 0:
+                out += data[i:]
+                break
+            out += data[i:j]
+            i = j
+        return bytes(out)
 
     def write(self, data: bytes):
-        if not self.log_file:
+        # Chatty streams (keystroke echo, ANSI redraws) hit this for
+        # every chunk, so accumulate and only touch the file in batches
+        if self.fd is None:
             return
         try:
-            text = data.decode('utf-8', errors='replace')
-            self.log_file.write(self.ANSI_ESCAPE.sub('', text))
-            self.log_file.flush()
+            stripped = self._strip_ansi(data)
+            self._buf.append(stripped)
+            self._buf_len += len(stripped)
+            if self._buf_len > self.FLUSH_THRESHOLD:
+                self.flush()
         except Exception:
             pass
 
+    def flush(self):
+        """Hand buffered output to the writer thread; called by the tab's timer"""
+        if self.fd is None or not self._buf:
+            return
+        self._writer.queue.put_nowait(b''.join(self._buf))
+        self._buf.clear()
+        self._buf_len = 0
+
     def close(self):
-        if self.log_file:
+        if self.fd is not None:
+            self.flush()
+            footer = f"\n\n=== Session ended: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n".encode()
+            self._writer.queue.put_nowait(footer)
+            self._writer.stop()
             try:
-                self.log_file.write(f"\n\n=== Session ended: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-                self.log_file.close()
+                os.close(self.fd)
             except Exception:
                 pass
-            self.log_file = None
+            self.fd = None
 
     @property
     def is_active(self) -> bool:
-        return self.log_file is not None
+        return self.fd is not None
 
 
 class DragDropTree(QTreeWidget):
     """Tree widget with drag & drop support"""
 
     item_moved = pyqtSignal(object, object)
-    ROLE_TYPE = Qt.UserRole
-    ROLE_ID = Qt.UserRole + 1
+    # One (type, id) tuple under a single role: half the sip/Qt data()
+    # crossings per item compared to separate type and id roles
+    ROLE_PAYLOAD = Qt.UserRole
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -162,6 +282,28 @@ class DragDropTree(QTreeWidget):
         self.setDragDropMode(QAbstractItemView.DragDrop)
         self.setDefaultDropAction(Qt.MoveAction)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._id_to_item: Dict[str, QTreeWidgetItem] = {}
+        # Dragged payload, parsed once on drag enter; dragMoveEvent
+        # fires continuously and must not re-decode the MIME data
+        self._drag_type = None
+        self._drag_id = None
+
+    def set_index(self, id_to_item: Dict[str, QTreeWidgetItem]):
+        """Install the id → item map built during a tree refresh"""
+        self._id_to_item = id_to_item
+
+    def item_for(self, item_id: str) -> Optional[QTreeWidgetItem]:
+        return self._id_to_item.get(item_id)
+
+    def register_item(self, item_id: str, item: QTreeWidgetItem):
+        self._id_to_item[item_id] = item
+
+    def unregister_item(self, item_id: str):
+        self._id_to_item.pop(item_id, None)
+
+    def clear(self):
+        self._id_to_item = {}
+        super().clear()
 
     MIME_TYPE = 'application/x-ssh-manager-item'
 
@@ -171,8 +313,8 @@ class DragDropTree(QTreeWidget):
     def mimeData(self, items):
         mime = QMimeData()
         if items:
-            item = items[0]
-            data = f"{item.data(0, self.ROLE_TYPE)}:{item.data(0, self.ROLE_ID)}"
+            item_type, item_id = items[0].data(0, self.ROLE_PAYLOAD)
+            data = f"{item_type}:{item_id}"
             mime.setData(self.MIME_TYPE, data.encode())
         return mime
 
@@ -185,39 +327,43 @@ class DragDropTree(QTreeWidget):
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasFormat(self.MIME_TYPE):
+            self._drag_type, self._drag_id = self._parse_mime(event)
             event.acceptProposedAction()
         else:
+            self._drag_type = self._drag_id = None
             event.ignore()
 
     def dragMoveEvent(self, event):
-        if not event.mimeData().hasFormat(self.MIME_TYPE):
+        if self._drag_type is None:
             event.ignore()
             return
 
         target = self.itemAt(event.pos())
-        item_type, item_id = self._parse_mime(event)
+        item_type, item_id = self._drag_type, self._drag_id
+        target_type, target_id = target.data(0, self.ROLE_PAYLOAD) if target else (None, None)
 
         if item_type == 'connection':
-            if target is None or target.data(0, self.ROLE_TYPE) == 'folder':
+            if target is None or target_type == 'folder':
                 event.acceptProposedAction()
                 return
         elif item_type == 'folder':
             if target is None:
                 event.acceptProposedAction()
                 return
-            if target.data(0, self.ROLE_TYPE) == 'folder' and target.data(0, self.ROLE_ID) != item_id:
+            if target_type == 'folder' and target_id != item_id:
                 event.acceptProposedAction()
                 return
 
         event.ignore()
 
     def dropEvent(self, event):
-        if not event.mimeData().hasFormat(self.MIME_TYPE):
+        if self._drag_type is None or not event.mimeData().hasFormat(self.MIME_TYPE):
             event.ignore()
             return
 
         target = self.itemAt(event.pos())
-        item_type, item_id = self._parse_mime(event)
+        item_type, item_id = self._drag_type, self._drag_id
+        self._drag_type = self._drag_id = None
 
         if not self._find_item_by_id(item_id):
             event.ignore()
@@ -225,59 +371,50 @@ class DragDropTree(QTreeWidget):
 
         new_parent_id = ""
         if target:
-            if target.data(0, self.ROLE_TYPE) == 'folder':
-                new_parent_id = target.data(0, self.ROLE_ID)
-            elif target.data(0, self.ROLE_TYPE) == 'connection':
+            target_type, target_id = target.data(0, self.ROLE_PAYLOAD)
+            if target_type == 'folder':
+                new_parent_id = target_id
+            elif target_type == 'connection':
                 parent = target.parent()
                 if parent:
-                    new_parent_id = parent.data(0, self.ROLE_ID)
+                    new_parent_id = parent.data(0, self.ROLE_PAYLOAD)[1]
 
         self.item_moved.emit({'type': item_type, 'id': item_id}, new_parent_id)
         event.acceptProposedAction()
 
     def _find_item_by_id(self, item_id: str) -> Optional[QTreeWidgetItem]:
-        def search(parent):
-            for i in range(parent.childCount()):
-                child = parent.child(i)
-                if child.data(0, self.ROLE_ID) == item_id:
-                    return child
-                found = search(child)
-                if found:
-                    return found
-            return None
-
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item.data(0, self.ROLE_ID) == item_id:
-                return item
-            found = search(item)
-            if found:
-                return found
-        return None
-
-
-class ConnectionThread(QThread):
-    """Thread for establishing connections without blocking UI"""
+        return self.item_for(item_id)
+
 
+class _ConnectSignals(QObject):
     connected = pyqtSignal()
     failed = pyqtSignal(str)
 
-    def __init__(self, session, parent=None):
-        super().__init__(parent)
+
+class ConnectTask(QRunnable):
+    """Establishes a connection on the global thread pool.
+
+    Reusing pool threads avoids a dedicated QThread spin-up per tab and
+    bounds concurrency when many tabs are opened at once.
+    """
+
+    def __init__(self, session):
+        super().__init__()
         self.session = session
+        self.signals = _ConnectSignals()
         self._cancelled = False
 
     def run(self):
         try:
             if self.session.connect():
                 if not self._cancelled:
-                    self.connected.emit()
+                    self.signals.connected.emit()
             else:
                 if not self._cancelled:
-                    self.failed.emit("Connection failed")
+                    self.signals.failed.emit("Connection failed")
         except Exception as e:
             if not self._cancelled:
-                self.failed.emit(str(e))
+                self.signals.failed.emit(str(e))
 
     def cancel(self):
         self._cancelled = True
@@ -289,14 +426,31 @@ class SessionTab(QWidget):
     """Widget containing a terminal session"""
 
     connection_status_changed = pyqtSignal(bool)
+    # Emitted from the session reader thread to wake the GUI thread;
+    # the queued delivery is what moves _flush_rx onto the event loop
+    _rx_pending = pyqtSignal()
 
     def __init__(self, connection: Connection, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.connection = connection
         self.config = config_manager
         self.session = None
-        self.connect_thread = None
+        self.connect_task = None
         self.logger = None
+        self._log_timer = None
+        # Debounce PTY resizes: size_changed fires per resize step and
+        # each forward is a window-change message over the wire
+        self._pending_size = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._do_resize)
+        # Coalesce received chunks: one terminal write (and one paint)
+        # per event-loop wakeup instead of per network chunk
+        self._rx_buf = bytearray()
+        self._rx_lock = threading.Lock()
+        self._rx_scheduled = False
+        self._rx_pending.connect(self._flush_rx)
 
         self._setup_ui()
         self._apply_terminal_settings()
@@ -327,6 +481,7 @@ class SessionTab(QWidget):
         layout.addWidget(self.status_widget)
 
         # Terminal
+        from .terminal import TerminalWidget
         self.terminal = TerminalWidget()
         self.terminal.data_to_send.connect(self._on_data_to_send)
         self.terminal.size_changed.connect(self._on_size_changed)
@@ -347,8 +502,12 @@ class SessionTab(QWidget):
                                         log_cfg.get('include_date_prefix', True))
             if self.logger.is_active:
                 self.terminal.write_data(f"[Logging to: {self.logger.log_path.name}]\n".encode())
+                self._log_timer = QTimer(self)
+                self._log_timer.timeout.connect(self.logger.flush)
+                self._log_timer.start(500)
 
     def _start_connection(self):
+        from .sessions import SSHSession, SerialSession
         self.terminal.write_data(f"Connecting to {self.connection.name}...\n".encode())
         cols, rows = self.terminal.get_terminal_size()
 
@@ -362,10 +521,10 @@ class SessionTab(QWidget):
             config['_term_rows'] = rows
             self.session = SSHSession(config, self._on_data_received, self._on_error)
 
-        self.connect_thread = ConnectionThread(self.session, self)
-        self.connect_thread.connected.connect(self._on_connected)
-        self.connect_thread.failed.connect(self._on_connection_failed)
-        self.connect_thread.start()
+        self.connect_task = ConnectTask(self.session)
+        self.connect_task.signals.connected.connect(self._on_connected)
+        self.connect_task.signals.failed.connect(self._on_connection_failed)
+        QThreadPool.globalInstance().start(self.connect_task)
 
     def _on_connected(self):
         self.status_widget.hide()
@@ -379,35 +538,58 @@ class SessionTab(QWidget):
         self.connection_status_changed.emit(False)
 
     def _cancel_connection(self):
-        if self.connect_thread and self.connect_thread.isRunning():
-            self.connect_thread.cancel()
-            self.connect_thread.wait(1000)
+        if self.connect_task:
+            self.connect_task.cancel()
         self.status_widget.hide()
         self.terminal.write_data(b"\n[CANCELLED] Connection cancelled by user.\n")
 
     def _on_data_received(self, data: bytes):
-        self.terminal.write_data(data)
+        # Called on the session reader thread — only buffer and wake
+        with self._rx_lock:
+            self._rx_buf += data
+            if self._rx_scheduled:
+                return
+            self._rx_scheduled = True
+        self._rx_pending.emit()
+
+    def _flush_rx(self):
+        with self._rx_lock:
+            buf = bytes(self._rx_buf)
+            self._rx_buf.clear()
+            self._rx_scheduled = False
+        if not buf:
+            return
+        self.terminal.write_data(buf)
         if self.logger and self.logger.is_active:
-            self.logger.write(data)
+            self.logger.write(buf)
 
     def _on_data_to_send(self, data: bytes):
         if self.session and self.session.is_connected:
             self.session.send(data)
 
     def _on_size_changed(self, cols, rows):
-        if self.session and hasattr(self.session, 'resize'):
+        self._pending_size = (cols, rows)
+        self._resize_timer.start()
+
+    def _do_resize(self):
+        if self._pending_size and self.session and hasattr(self.session, 'resize'):
+            cols, rows = self._pending_size
             self.session.resize(cols, rows)
+        self._pending_size = None
 
     def _on_error(self, message):
         self.terminal.write_data(f"\n[ERROR] {message}\n".encode())
 
     def disconnect(self):
+        if self._log_timer:
+            self._log_timer.stop()
+            self._log_timer = None
         if self.logger:
             self.logger.close()
             self.logger = None
-        if self.connect_thread and self.connect_thread.isRunning():
-            self.connect_thread.cancel()
-            self.connect_thread.wait(1000)
+        if self.connect_task:
+            self.connect_task.cancel()
+            self.connect_task = None
         if self.session:
             self.session.disconnect()
             self.session = None
@@ -420,8 +602,7 @@ class SessionTab(QWidget):
 class MainWindow(QMainWindow):
     """Main application window"""
 
-    TREE_ROLE_TYPE = DragDropTree.ROLE_TYPE
-    TREE_ROLE_ID = DragDropTree.ROLE_ID
+    TREE_ROLE_PAYLOAD = DragDropTree.ROLE_PAYLOAD
 
     def __init__(self):
         super().__init__()
@@ -520,11 +701,14 @@ class MainWindow(QMainWindow):
         splitter.setSizes([220, 980])
 
     def _setup_shortcuts(self):
+        # Numeric key codes skip Qt's shortcut-string parser
+        self._tab_actions = []
         for i in range(1, 10):
             action = QAction(self)
-            action.setShortcut(QKeySequence(f"Ctrl+{i}"))
+            action.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_0 + i))
             action.triggered.connect(lambda _, idx=i - 1: self._switch_to_tab(idx))
             self.addAction(action)
+            self._tab_actions.append(action)
 
         for key, handler in [(QKeySequence.Delete, self._delete_selected),
                              (QKeySequence("F2"), self._edit_selected)]:
@@ -539,58 +723,115 @@ class MainWindow(QMainWindow):
         self.statusbar.showMessage("Ready")
 
     def _refresh_tree(self):
-        # Capture current expanded state from UI before clearing
+        # Capture current expanded state from UI before clearing;
+        # QTreeWidgetItemIterator traverses in C++, so this is one flat
+        # loop instead of a recursive descent through every item
         expanded_ids = set()
-        def _collect(item):
+        it = QTreeWidgetItemIterator(self.tree)
+        while it.value():
+            item = it.value()
             if item.isExpanded():
-                fid = item.data(0, self.TREE_ROLE_ID)
-                if fid:
-                    expanded_ids.add(fid)
-            for i in range(item.childCount()):
-                _collect(item.child(i))
-        for i in range(self.tree.topLevelItemCount()):
-            _collect(self.tree.topLevelItem(i))
+                payload = item.data(0, self.TREE_ROLE_PAYLOAD)
+                if payload and payload[1]:
+                    expanded_ids.add(payload[1])
+            it += 1
         had_items = self.tree.topLevelItemCount() > 0
 
+        # Coalesce repaints and item signals for the whole rebuild;
+        # expanding after the tree is fully populated is far cheaper
+        # than toggling expansion item by item mid-build
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+
         self.tree.clear()
-        folders = {f.id: f for f in self.config.get_folders()}
-        connections = self.config.get_connections()
+        folders = {f.id: f for f in self.config.iter_folders()}
+        connections = self.config.iter_connections()
         folder_items: Dict[str, QTreeWidgetItem] = {}
+        id_to_item: Dict[str, QTreeWidgetItem] = {}
 
         def _should_expand(fid, folder):
             return (fid in expanded_ids) if had_items else folder.expanded
 
-        # Root folders
-        for fid, folder in folders.items():
-            if not folder.parent_id:
-                item = QTreeWidgetItem([f"📁 {folder.name}"])
-                item.setData(0, self.TREE_ROLE_TYPE, "folder")
-                item.setData(0, self.TREE_ROLE_ID, fid)
-                self.tree.addTopLevelItem(item)
-                item.setExpanded(_should_expand(fid, folder))
-                folder_items[fid] = item
-
-        # Nested folders
-        for fid, folder in folders.items():
-            if folder.parent_id and folder.parent_id in folder_items:
-                item = QTreeWidgetItem([f"📁 {folder.name}"])
-                item.setData(0, self.TREE_ROLE_TYPE, "folder")
-                item.setData(0, self.TREE_ROLE_ID, fid)
-                folder_items[folder.parent_id].addChild(item)
-                item.setExpanded(_should_expand(fid, folder))
-                folder_items[fid] = item
+        # Folders, depth-first from the roots: one pass handles any
+        # nesting depth without per-folder parent containment checks
+        children_by_parent = defaultdict(list)
+        for folder in folders.values():
+            children_by_parent[folder.parent_id or ""].append(folder)
+
+        def _add_folders(parent_item, folder_list):
+            for folder in folder_list:
+                item = QTreeWidgetItem([folder.display_name])
+                item.setData(0, self.TREE_ROLE_PAYLOAD, ("folder", folder.id))
+                if parent_item is None:
+                    self.tree.addTopLevelItem(item)
+                else:
+                    parent_item.addChild(item)
+                folder_items[folder.id] = item
+                id_to_item[folder.id] = item
+                _add_folders(item, children_by_parent.get(folder.id, ()))
+
+        _add_folders(None, children_by_parent.get("", ()))
 
         # Connections
         for conn in connections:
-            emoji = "🖥" if conn.conn_type == "ssh" else "🔌"
-            item = QTreeWidgetItem([f"{emoji} {conn.name}"])
-            item.setData(0, self.TREE_ROLE_TYPE, "connection")
-            item.setData(0, self.TREE_ROLE_ID, conn.id)
+            item = QTreeWidgetItem([conn.display_name])
+            item.setData(0, self.TREE_ROLE_PAYLOAD, ("connection", conn.id))
             parent = folder_items.get(conn.folder_id)
             if parent:
                 parent.addChild(item)
             else:
                 self.tree.addTopLevelItem(item)
+            id_to_item[conn.id] = item
+
+        self.tree.set_index(id_to_item)
+
+        self.tree.expandAll()
+        for fid, folder in folders.items():
+            if fid in folder_items and not _should_expand(fid, folder):
+                folder_items[fid].setExpanded(False)
+
+        self.tree.blockSignals(False)
+        self.tree.setUpdatesEnabled(True)
+        self.tree.viewport().update()
+
+    # --- Incremental tree mutations ---
+    # Single add/edit/move touches one item instead of rebuilding the
+    # whole tree (which loses scroll position and churns item signals).
+    # Folder deletion reparents children to root, so that path still
+    # falls back to a full _refresh_tree.
+
+    def _tree_insert(self, kind: str, item_id: str, label: str, parent_id: str) -> QTreeWidgetItem:
+        item = QTreeWidgetItem([label])
+        item.setData(0, self.TREE_ROLE_PAYLOAD, (kind, item_id))
+        parent = self.tree.item_for(parent_id) if parent_id else None
+        if parent is not None:
+            parent.addChild(item)
+            parent.setExpanded(True)
+        else:
+            self.tree.addTopLevelItem(item)
+        self.tree.register_item(item_id, item)
+        return item
+
+    def _tree_reparent(self, item: QTreeWidgetItem, new_parent_id: str):
+        old_parent = item.parent()
+        if old_parent is not None:
+            old_parent.removeChild(item)
+        else:
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+        new_parent = self.tree.item_for(new_parent_id) if new_parent_id else None
+        if new_parent is not None:
+            new_parent.addChild(item)
+            new_parent.setExpanded(True)
+        else:
+            self.tree.addTopLevelItem(item)
+
+    def _tree_remove(self, item: QTreeWidgetItem, item_id: str):
+        parent = item.parent()
+        if parent is not None:
+            parent.removeChild(item)
+        else:
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+        self.tree.unregister_item(item_id)
 
     # --- Context menu & actions ---
 
@@ -598,7 +839,7 @@ class MainWindow(QMainWindow):
         item = self.tree.itemAt(pos)
         menu = QMenu(self)
         if item:
-            if item.data(0, self.TREE_ROLE_TYPE) == "connection":
+            if item.data(0, self.TREE_ROLE_PAYLOAD)[0] == "connection":
                 menu.addAction("Connect", self._connect_selected)
                 menu.addSeparator()
             menu.addAction("Edit", self._edit_selected)
@@ -609,7 +850,7 @@ class MainWindow(QMainWindow):
         menu.exec_(self.tree.mapToGlobal(pos))
 
     def _on_item_double_clicked(self, item, column):
-        if item.data(0, self.TREE_ROLE_TYPE) == "connection":
+        if item.data(0, self.TREE_ROLE_PAYLOAD)[0] == "connection":
             self._connect_selected()
 
     def _on_item_moved(self, item_info, new_parent_id):
@@ -624,17 +865,20 @@ class MainWindow(QMainWindow):
             if folder:
                 folder.parent_id = new_parent_id
                 self.config.update_folder(folder)
-        self._refresh_tree()
+        item = self.tree.item_for(item_id)
+        if item is not None:
+            self._tree_reparent(item, new_parent_id)
         self.statusbar.showMessage(f"{item_type.title()} moved", 2000)
 
     def _get_selected_folder_id(self) -> str:
         item = self.tree.currentItem()
         if not item:
             return ""
-        if item.data(0, self.TREE_ROLE_TYPE) == "folder":
-            return item.data(0, self.TREE_ROLE_ID)
-        if item.data(0, self.TREE_ROLE_TYPE) == "connection":
-            conn = self.config.get_connection_by_id(item.data(0, self.TREE_ROLE_ID))
+        item_type, item_id = item.data(0, self.TREE_ROLE_PAYLOAD)
+        if item_type == "folder":
+            return item_id
+        if item_type == "connection":
+            conn = self.config.get_connection_by_id(item_id)
             return conn.folder_id if conn else ""
         return ""
 
@@ -646,40 +890,45 @@ class MainWindow(QMainWindow):
             conn.ssh_config['terminal'] = default_term
         dialog = ConnectionDialog(conn, self)
         if dialog.exec_():
-            self.config.add_connection(dialog.get_connection())
-            self._refresh_tree()
+            new_conn = dialog.get_connection()
+            self.config.add_connection(new_conn)
+            self._tree_insert("connection", new_conn.id,
+                              new_conn.display_name, new_conn.folder_id)
             self.statusbar.showMessage("Connection created", 3000)
 
     def _new_folder(self):
         folder = Folder(parent_id=self._get_selected_folder_id())
         dialog = FolderDialog(folder, self)
         if dialog.exec_():
-            self.config.add_folder(dialog.get_folder())
-            self._refresh_tree()
+            new_folder = dialog.get_folder()
+            self.config.add_folder(new_folder)
+            self._tree_insert("folder", new_folder.id,
+                              new_folder.display_name, new_folder.parent_id)
             self.statusbar.showMessage("Folder created", 3000)
 
     def _edit_selected(self):
         item = self.tree.currentItem()
         if not item:
             return
-        item_type = item.data(0, self.TREE_ROLE_TYPE)
-        item_id = item.data(0, self.TREE_ROLE_ID)
+        item_type, item_id = item.data(0, self.TREE_ROLE_PAYLOAD)
 
         if item_type == "connection":
             conn = self.config.get_connection_by_id(item_id)
             if conn:
                 dialog = ConnectionDialog(conn, self)
                 if dialog.exec_():
-                    self.config.update_connection(dialog.get_connection())
-                    self._refresh_tree()
+                    updated = dialog.get_connection()
+                    self.config.update_connection(updated)
+                    item.setText(0, updated.display_name)
                     self.statusbar.showMessage("Connection updated", 3000)
         elif item_type == "folder":
             folder = self.config.get_folder_by_id(item_id)
             if folder:
                 dialog = FolderDialog(folder, self)
                 if dialog.exec_():
-                    self.config.update_folder(dialog.get_folder())
-                    self._refresh_tree()
+                    updated = dialog.get_folder()
+                    self.config.update_folder(updated)
+                    item.setText(0, updated.display_name)
                     self.statusbar.showMessage("Folder updated", 3000)
 
     def _delete_selected(self):
@@ -690,20 +939,23 @@ class MainWindow(QMainWindow):
         reply = QMessageBox.question(self, "Confirm Delete", f"Delete {name}?",
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            item_type = item.data(0, self.TREE_ROLE_TYPE)
-            item_id = item.data(0, self.TREE_ROLE_ID)
+            item_type, item_id = item.data(0, self.TREE_ROLE_PAYLOAD)
             if item_type == "connection":
                 self.config.delete_connection(item_id)
+                self._tree_remove(item, item_id)
             elif item_type == "folder":
+                # Deleting a folder reparents its children to root in the
+                # config, so rebuild rather than chase the cascade
                 self.config.delete_folder(item_id)
-            self._refresh_tree()
+                self._refresh_tree()
             self.statusbar.showMessage("Deleted", 3000)
 
     def _connect_selected(self):
         item = self.tree.currentItem()
-        if not item or item.data(0, self.TREE_ROLE_TYPE) != "connection":
+        payload = item.data(0, self.TREE_ROLE_PAYLOAD) if item else None
+        if not payload or payload[0] != "connection":
             return
-        conn_id = item.data(0, self.TREE_ROLE_ID)
+        conn_id = payload[1]
         conn = self.config.get_connection_by_id(conn_id)
         if not conn:
             return
@@ -733,12 +985,15 @@ class MainWindow(QMainWindow):
             self.tabs.setCurrentIndex(index)
 
     def _show_serial_ports(self):
+        from .dialogs import SerialPortsDialog
         SerialPortsDialog(self).exec_()
 
     def _show_password_manager(self):
+        from .dialogs import PasswordManagerDialog
         PasswordManagerDialog(self.config.get_connections(), self).exec_()
 
     def _show_settings(self):
+        from .dialogs import SettingsDialog
         settings = self.config.get_app_settings()
         dialog = SettingsDialog(settings, self)
         if dialog.exec_():
@@ -753,4 +1008,5 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         for tab in self.sessions.values():
             tab.disconnect()
+        self.config.flush()
         event.accept()
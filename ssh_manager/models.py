@@ -3,11 +3,22 @@ Data models for SSH Manager
 """
 
 from dataclasses import dataclass, field, asdict
+from functools import cached_property
 from typing import Optional, List, Dict
 from enum import Enum
 import json
-import uuid
+import os
+import threading
+import secrets
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    # C-implemented JSON; noticeably faster to load/dump large configs.
+    # Optional — everything works on stdlib json without it.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class ConnectionType(Enum):
@@ -15,34 +26,52 @@ class ConnectionType(Enum):
     SERIAL = "serial"
 
 
-# Default terminal settings
-DEFAULT_TERMINAL_SETTINGS = {
+# Default terminal settings (read-only view so no caller can mutate
+# the shared template; use the _new_* factories for fresh copies)
+DEFAULT_TERMINAL_SETTINGS = MappingProxyType({
     'bg_color': '#1e1e2e',
     'fg_color': '#cdd6f4',
     'cursor_color': '#f5e0dc',
     'font_family': '',
     'font_size': 11,
     'syntax_highlight': True,
-}
+})
 
 # Default logging settings
-DEFAULT_LOGGING_SETTINGS = {
+DEFAULT_LOGGING_SETTINGS = MappingProxyType({
     'enabled': False,
     'log_dir': '',  # Empty = default (~/.config/ssh_manager/logs)
     'timestamp_format': '%Y-%m-%d_%H-%M-%S',
     'include_date_prefix': True,
-}
+})
 
 
-@dataclass
+def _new_terminal_settings() -> Dict:
+    return {**DEFAULT_TERMINAL_SETTINGS}
+
+
+def _new_logging_settings() -> Dict:
+    return {**DEFAULT_LOGGING_SETTINGS}
+
+
+@dataclass(slots=True)
 class AppSettings:
     """Application-wide settings"""
     theme: str = "dark"  # "dark" or "light"
-    default_terminal: Dict = field(default_factory=lambda: DEFAULT_TERMINAL_SETTINGS.copy())
-    logging: Dict = field(default_factory=lambda: DEFAULT_LOGGING_SETTINGS.copy())
+    default_terminal: Dict = field(default_factory=_new_terminal_settings)
+    logging: Dict = field(default_factory=_new_logging_settings)
 
+    def to_dict(self) -> Dict:
+        # Flat fields plus dicts of primitives: a literal build avoids
+        # asdict's recursive deepcopy of every value
+        return {
+            "theme": self.theme,
+            "default_terminal": dict(self.default_terminal),
+            "logging": dict(self.logging),
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class SSHConfig:
     """SSH connection configuration"""
     host: str = ""
@@ -57,7 +86,7 @@ class SSHConfig:
     hostkeys: str = ""
     macs: str = ""
     # Terminal settings
-    terminal: Dict = field(default_factory=lambda: DEFAULT_TERMINAL_SETTINGS.copy())
+    terminal: Dict = field(default_factory=_new_terminal_settings)
     # Legacy (kept for compatibility)
     use_legacy_ciphers: bool = False
     legacy_ciphers: List[str] = field(default_factory=list)
@@ -65,7 +94,7 @@ class SSHConfig:
     legacy_host_keys: List[str] = field(default_factory=list)
 
 
-@dataclass  
+@dataclass(slots=True)
 class SerialConfig:
     """Serial/TTY connection configuration"""
     port: str = ""
@@ -88,18 +117,54 @@ class Connection:
     
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())[:8]
+            self.id = secrets.token_hex(4)
         if self.ssh_config is None:
             self.ssh_config = asdict(SSHConfig())
         if self.serial_config is None:
             self.serial_config = asdict(SerialConfig())
     
-    def get_ssh_config(self) -> SSHConfig:
+    @cached_property
+    def display_name(self) -> str:
+        emoji = "\U0001f5a5" if self.conn_type == "ssh" else "\U0001f50c"
+        return f"{emoji} {self.name}"
+
+    def __setattr__(self, key, value):
+        # Rendered label depends on name/conn_type; drop the cache on edit
+        if key in ('name', 'conn_type'):
+            self.__dict__.pop('display_name', None)
+        elif key == 'ssh_config':
+            self.__dict__.pop('_ssh_cfg_obj', None)
+        elif key == 'serial_config':
+            self.__dict__.pop('_serial_cfg_obj', None)
+        super().__setattr__(key, value)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "conn_type": self.conn_type,
+            "folder_id": self.folder_id,
+            "ssh_config": dict(self.ssh_config) if self.ssh_config else self.ssh_config,
+            "serial_config": dict(self.serial_config) if self.serial_config else self.serial_config,
+        }
+
+    # Config objects are rebuilt lazily and kept until the backing dict
+    # is reassigned (in-place mutation of the dict doesn't invalidate;
+    # callers always replace the whole dict)
+    @cached_property
+    def _ssh_cfg_obj(self) -> SSHConfig:
         return SSHConfig(**self.ssh_config)
-    
-    def get_serial_config(self) -> SerialConfig:
+
+    @cached_property
+    def _serial_cfg_obj(self) -> SerialConfig:
         return SerialConfig(**self.serial_config)
 
+    def get_ssh_config(self) -> SSHConfig:
+        return self._ssh_cfg_obj
+
+    def get_serial_config(self) -> SerialConfig:
+        return self._serial_cfg_obj
+
 
 @dataclass
 class Folder:
@@ -111,7 +176,24 @@ class Folder:
     
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid.uuid4())[:8]
+            self.id = secrets.token_hex(4)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "parent_id": self.parent_id,
+            "expanded": self.expanded,
+        }
+
+    @cached_property
+    def display_name(self) -> str:
+        return f"\U0001f4c1 {self.name}"
+
+    def __setattr__(self, key, value):
+        if key == 'name':
+            self.__dict__.pop('display_name', None)
+        super().__setattr__(key, value)
 
 
 class ConfigManager:
@@ -123,33 +205,88 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         self.data = self._load()
+        self._app_settings_cache = None
+        self._rebuild_indexes()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # Reentrant: mutators hold it across their edit *and* the
+        # save() call, so the timer-thread flush can never serialize
+        # self.data while a mutation is in flight
+        self._save_lock = threading.RLock()
+
+    def _rebuild_indexes(self):
+        # Map id -> list position so lookups and updates skip the linear
+        # scan over self.data. Rebuilt whenever a delete shifts positions.
+        self._conn_index = {c["id"]: i for i, c in enumerate(self.data.get("connections", []))}
+        self._folder_index = {f["id"]: i for i, f in enumerate(self.data.get("folders", []))}
     
     def _load(self) -> Dict:
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    raw = f.read()
+                return orjson.loads(raw) if orjson else json.loads(raw)
             except Exception:
                 pass
         return {"folders": [], "connections": [], "settings": {}}
     
     def save(self):
-        with open(self.config_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        """Coalesce the write: rewriting the whole JSON file on every
+        mutation is O(n²) I/O during bulk edits, so mark the data dirty
+        and flush once after a short quiet period."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(0.5, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes to disk (called on the debounce timer
+        and on application exit)."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            # Write to a sibling temp file and rename so a crash
+            # mid-write never leaves a truncated config behind
+            tmp_path = self.config_path.with_suffix('.json.tmp')
+            if orjson:
+                payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.data, indent=2).encode()
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                # Durable before the rename: the debounce means one
+                # fsync covers a whole burst of mutations
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            # Cleared only after the file is safely in place; if the
+            # dump or write raises, the data stays dirty and the next
+            # save() re-arms the timer
+            self._dirty = False
     
     def get_app_settings(self) -> AppSettings:
         """Get application settings"""
-        settings_data = self.data.get("settings", {})
-        return AppSettings(
-            theme=settings_data.get("theme", "dark"),
-            default_terminal=settings_data.get("default_terminal", DEFAULT_TERMINAL_SETTINGS.copy()),
-            logging=settings_data.get("logging", DEFAULT_LOGGING_SETTINGS.copy())
-        )
+        # Rebuilt only after update_app_settings; every tab open reads
+        # these, so don't reconstruct the dataclass each time
+        if self._app_settings_cache is None:
+            settings_data = self.data.get("settings", {})
+            self._app_settings_cache = AppSettings(
+                theme=settings_data.get("theme", "dark"),
+                default_terminal=settings_data.get("default_terminal") or _new_terminal_settings(),
+                logging=settings_data.get("logging") or _new_logging_settings()
+            )
+        return self._app_settings_cache
     
     def update_app_settings(self, settings: AppSettings):
         """Update application settings"""
-        self.data["settings"] = asdict(settings)
-        self.save()
+        with self._save_lock:
+            self.data["settings"] = settings.to_dict()
+            self._app_settings_cache = None
+            self.save()
     
     def get_default_terminal_settings(self) -> Dict:
         """Get default terminal settings for new connections"""
@@ -169,67 +306,85 @@ class ConfigManager:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    def iter_folders(self):
+        """Yield Folder objects lazily; use when the caller only
+        iterates (avoids materializing the whole list)."""
+        for f in self.data.get("folders", []):
+            yield Folder(**f)
+
+    def iter_connections(self):
+        for c in self.data.get("connections", []):
+            yield Connection(**c)
+
     def get_folders(self) -> List[Folder]:
-        return [Folder(**f) for f in self.data.get("folders", [])]
-    
+        return list(self.iter_folders())
+
     def get_connections(self) -> List[Connection]:
-        return [Connection(**c) for c in self.data.get("connections", [])]
+        return list(self.iter_connections())
     
     def add_folder(self, folder: Folder):
-        self.data.setdefault("folders", []).append(asdict(folder))
-        self.save()
-    
+        with self._save_lock:
+            folders = self.data.setdefault("folders", [])
+            self._folder_index[folder.id] = len(folders)
+            folders.append(folder.to_dict())
+            self.save()
+
     def update_folder(self, folder: Folder):
-        folders = self.data.get("folders", [])
-        for i, f in enumerate(folders):
-            if f["id"] == folder.id:
-                folders[i] = asdict(folder)
-                break
-        self.save()
-    
+        with self._save_lock:
+            i = self._folder_index.get(folder.id)
+            if i is not None:
+                self.data["folders"][i] = folder.to_dict()
+            self.save()
+
     def delete_folder(self, folder_id: str):
         # Delete folder and move children to root
-        self.data["folders"] = [
-            f for f in self.data.get("folders", [])
-            if f["id"] != folder_id
-        ]
-        # Update connections in this folder
-        for c in self.data.get("connections", []):
-            if c.get("folder_id") == folder_id:
-                c["folder_id"] = ""
-        # Update subfolders
-        for f in self.data.get("folders", []):
-            if f.get("parent_id") == folder_id:
-                f["parent_id"] = ""
-        self.save()
-    
+        with self._save_lock:
+            self.data["folders"] = [
+                f for f in self.data.get("folders", [])
+                if f["id"] != folder_id
+            ]
+            # Update connections in this folder
+            for c in self.data.get("connections", []):
+                if c.get("folder_id") == folder_id:
+                    c["folder_id"] = ""
+            # Update subfolders
+            for f in self.data.get("folders", []):
+                if f.get("parent_id") == folder_id:
+                    f["parent_id"] = ""
+            self._rebuild_indexes()
+            self.save()
+
     def add_connection(self, conn: Connection):
-        self.data.setdefault("connections", []).append(asdict(conn))
-        self.save()
-    
+        with self._save_lock:
+            connections = self.data.setdefault("connections", [])
+            self._conn_index[conn.id] = len(connections)
+            connections.append(conn.to_dict())
+            self.save()
+
     def update_connection(self, conn: Connection):
-        connections = self.data.get("connections", [])
-        for i, c in enumerate(connections):
-            if c["id"] == conn.id:
-                connections[i] = asdict(conn)
-                break
-        self.save()
-    
+        with self._save_lock:
+            i = self._conn_index.get(conn.id)
+            if i is not None:
+                self.data["connections"][i] = conn.to_dict()
+            self.save()
+
     def delete_connection(self, conn_id: str):
-        self.data["connections"] = [
-            c for c in self.data.get("connections", [])
-            if c["id"] != conn_id
-        ]
-        self.save()
-    
+        with self._save_lock:
+            self.data["connections"] = [
+                c for c in self.data.get("connections", [])
+                if c["id"] != conn_id
+            ]
+            self._rebuild_indexes()
+            self.save()
+
     def get_connection_by_id(self, conn_id: str) -> Optional[Connection]:
-        for c in self.data.get("connections", []):
-            if c["id"] == conn_id:
-                return Connection(**c)
-        return None
-    
+        i = self._conn_index.get(conn_id)
+        if i is None:
+            return None
+        return Connection(**self.data["connections"][i])
+
     def get_folder_by_id(self, folder_id: str) -> Optional[Folder]:
-        for f in self.data.get("folders", []):
-            if f["id"] == folder_id:
-                return Folder(**f)
-        return None
+        i = self._folder_index.get(folder_id)
+        if i is None:
+            return None
+        return Folder(**self.data["folders"][i])
@@ -2,7 +2,9 @@
 Session handlers for SSH and Serial connections
 """
 
+import functools
 import os
+import selectors
 import socket
 import threading
 import time
@@ -12,37 +14,170 @@ import paramiko
 import serial
 
 
+class _SessionReactor:
+    """Single reader thread multiplexing every open session.
+
+    One thread per session meant N parked threads and N sets of
+    wakeups; instead all channels/ports register their fd here and one
+    epoll loop dispatches readable ones to the owning session. A
+    socketpair nudges the selector when the registration set changes.
+    """
+
+    def __init__(self):
+        self._sel = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._sel.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, fileobj, callback: Callable[[], None]):
+        with self._lock:
+            self._sel.register(fileobj, selectors.EVENT_READ, callback)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wakeup()
+
+    def unregister(self, fileobj):
+        with self._lock:
+            try:
+                self._sel.unregister(fileobj)
+            except (KeyError, ValueError):
+                pass
+        self._wakeup()
+
+    def _wakeup(self):
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass
+
+    def _run(self):
+        while True:
+            events = self._sel.select(timeout=1.0)
+            for key, _ in events:
+                if key.data is None:
+                    try:
+                        self._wake_r.recv(4096)
+                    except OSError:
+                        pass
+                    continue
+                key.data()
+
+
+_reactor = _SessionReactor()
+
+# Passed to paramiko when custom algorithms are configured: empty
+# "disabled" lists re-enable the legacy algorithms paramiko turns off
+# by default. Shared read-only so connect() allocates nothing.
+_EMPTY_DISABLED_ALGS = {
+    'ciphers': (),
+    'kex': (),
+    'keys': (),
+    'macs': (),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _known_host_keys() -> paramiko.HostKeys:
+    """Parse ~/.ssh/known_hosts once per process.
+
+    Every SSHSession seeds its client from this shared copy, so known
+    hosts verify against the cached keys instead of falling through to
+    the missing-key policy, and the file is never re-read per connect.
+    """
+    path = os.path.expanduser(os.path.join("~", ".ssh", "known_hosts"))
+    try:
+        if os.path.exists(path):
+            return paramiko.HostKeys(path)
+    except Exception:
+        pass
+    return paramiko.HostKeys()
+
+
+# Live SSHClients shared across sessions targeting the same endpoint:
+# additional tabs open a new channel over the existing transport and
+# skip the TCP + key-exchange handshake entirely. Entries are
+# refcounted so the transport closes with its last session.
+_CLIENT_POOL: dict = {}
+_POOL_REFS: dict = {}
+_POOL_LOCK = threading.Lock()
+
+
 class SSHSession:
     """Handles SSH connections"""
-    
+
     def __init__(self, config: dict, on_data: Callable[[bytes], None], on_error: Callable[[str], None]):
         self.config = config
         self.on_data = on_data
         self.on_error = on_error
-        
+
         self.client: Optional[paramiko.SSHClient] = None
         self.channel: Optional[paramiko.Channel] = None
         self.running = False
-        self.thread: Optional[threading.Thread] = None
-    
+        self._pool_key = None
+
+    def _open_shell(self):
+        self.channel = self.client.invoke_shell(
+            term='xterm-256color',
+            width=self.config.get('_term_cols', 80),
+            height=self.config.get('_term_rows', 24)
+        )
+        # send() runs on the GUI thread: without a timeout it blocks
+        # indefinitely once the transport window fills (remote stopped
+        # draining). Harmless to the reactor reads, which are gated on
+        # recv_ready().
+        self.channel.settimeout(0.1)
+        self.running = True
+        _reactor.register(self.channel, self._on_readable)
+
     def connect(self) -> bool:
         """Establish SSH connection"""
         try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
             hostname = self.config.get("host", "")
             port = self.config.get("port", 22)
             username = self.config.get("username", "")
-            
+
             if not hostname:
                 self.on_error("Host is not specified")
                 return False
-            
+
             if not username:
                 self.on_error("Username is not specified")
                 return False
-            
+
+            # Reuse a pooled client when another tab already holds a
+            # live transport to this endpoint
+            key = (hostname, port, username)
+            with _POOL_LOCK:
+                pooled = _CLIENT_POOL.get(key)
+                transport = pooled.get_transport() if pooled else None
+                if transport is not None and transport.is_active():
+                    _POOL_REFS[key] += 1
+                else:
+                    pooled = None
+            if pooled is not None:
+                try:
+                    self.client = pooled
+                    self._pool_key = key
+                    self._open_shell()
+                    return True
+                except Exception:
+                    # Transport died between the liveness check and the
+                    # open; drop it and fall through to a fresh connect
+                    with _POOL_LOCK:
+                        _POOL_REFS[key] -= 1
+                        if _POOL_REFS[key] <= 0:
+                            _CLIENT_POOL.pop(key, None)
+                            _POOL_REFS.pop(key, None)
+                    self.client = None
+                    self._pool_key = None
+
+            self.client = paramiko.SSHClient()
+            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            self.client.get_host_keys().update(_known_host_keys())
+
             connect_kwargs = {
                 "hostname": hostname,
                 "port": port,
@@ -66,10 +201,6 @@ class SSHSession:
                 self.on_error("No password or key file specified")
                 return False
             
-            # Build disabled_algorithms dict to ENABLE legacy algorithms
-            # Paramiko by default disables insecure algorithms, we need to un-disable them
-            disabled_algorithms = {}
-            
             ciphers = self.config.get("ciphers", "")
             kex = self.config.get("kex", "")
             hostkeys = self.config.get("hostkeys", "")
@@ -77,35 +208,29 @@ class SSHSession:
             
             # If custom algorithms specified, we need to work with paramiko's security options
             if ciphers or kex or hostkeys or macs:
-                # For legacy support, we tell paramiko not to disable these algorithms
-                # by providing empty disabled lists
-                disabled_algorithms = {
-                    'ciphers': [],
-                    'kex': [],
-                    'keys': [],
-                    'macs': [],
-                }
-                connect_kwargs['disabled_algorithms'] = disabled_algorithms
+                connect_kwargs['disabled_algorithms'] = _EMPTY_DISABLED_ALGS
             
             self.client.connect(**connect_kwargs)
-            
+
+            # Widen the flow-control window before opening the shell
+            # channel so bulk transfers aren't throttled waiting for
+            # window adjustments (pairs with the 64 KB recvs in
+            # _on_readable)
+            self.client.get_transport().default_window_size = 2097152
+
             # After connection, if we have specific algorithm preferences,
             # they would have been negotiated. For most legacy devices,
             # just allowing the algorithms (not disabling them) is enough.
-            
-            self.channel = self.client.invoke_shell(
-                term='xterm-256color',
-                width=self.config.get('_term_cols', 80),
-                height=self.config.get('_term_rows', 24)
-            )
-            self.channel.settimeout(0.1)
-            
-            self.running = True
-            self.thread = threading.Thread(target=self._read_loop, daemon=True)
-            self.thread.start()
-            
+
+            with _POOL_LOCK:
+                _CLIENT_POOL[key] = self.client
+                _POOL_REFS[key] = 1
+            self._pool_key = key
+
+            self._open_shell()
+
             return True
-        
+
         except paramiko.AuthenticationException:
             self.on_error("Authentication failed - check username/password")
             return False
@@ -128,19 +253,38 @@ class SSHSession:
             self.on_error(f"Connection failed: {e}")
             return False
     
-    def _read_loop(self):
-        """Background thread reading from SSH channel"""
-        while self.running and self.channel:
-            try:
-                if self.channel.recv_ready():
-                    data = self.channel.recv(4096)
-                    if data:
-                        self.on_data(data)
-                time.sleep(0.01)
-            except Exception as e:
-                if self.running:
-                    self.on_error(f"SSH read error: {e}")
-                break
+    def _on_readable(self):
+        """Reactor callback: drain the channel while data is buffered.
+
+        Coalesces back-to-back chunks into one on_data call so bulky
+        output pays the signal/redraw cost per batch, not per 4 KB
+        chunk. Bounded to keep latency low.
+        """
+        channel = self.channel
+        if not self.running or channel is None:
+            return
+        try:
+            if not channel.recv_ready():
+                # Readable but nothing buffered means EOF/close
+                if channel.closed or channel.eof_received:
+                    _reactor.unregister(channel)
+                    self.running = False
+                return
+            buf = bytearray()
+            deadline = time.perf_counter() + 0.002
+            while self.running and channel.recv_ready():
+                data = channel.recv(65536)
+                if not data:
+                    break
+                buf += data
+                if len(buf) >= 65536 or time.perf_counter() >= deadline:
+                    break
+            if buf:
+                self.on_data(bytes(buf))
+        except Exception as e:
+            _reactor.unregister(channel)
+            if self.running:
+                self.on_error(f"SSH read error: {e}")
     
     def send(self, data: bytes):
         """Send data to SSH channel"""
@@ -161,19 +305,33 @@ class SSHSession:
     def disconnect(self):
         """Close SSH connection"""
         self.running = False
-        
+
         if self.channel:
+            _reactor.unregister(self.channel)
             try:
                 self.channel.close()
             except Exception:
                 pass
             self.channel = None
-        
+
         if self.client:
-            try:
-                self.client.close()
-            except Exception:
-                pass
+            # Only close the shared client once its last session is gone
+            close_client = True
+            if self._pool_key is not None:
+                with _POOL_LOCK:
+                    refs = _POOL_REFS.get(self._pool_key, 1) - 1
+                    if refs > 0:
+                        _POOL_REFS[self._pool_key] = refs
+                        close_client = False
+                    else:
+                        _CLIENT_POOL.pop(self._pool_key, None)
+                        _POOL_REFS.pop(self._pool_key, None)
+                self._pool_key = None
+            if close_client:
+                try:
+                    self.client.close()
+                except Exception:
+                    pass
             self.client = None
     
     @property
@@ -207,55 +365,71 @@ class SerialSession:
         
         self.serial_conn: Optional[serial.Serial] = None
         self.running = False
-        self.thread: Optional[threading.Thread] = None
-    
+        # Reused receive buffer: readinto() lands bytes here directly,
+        # so steady-state reads allocate only the final handoff bytes
+        self._rx = bytearray(65536)
+
+        # Resolve the stored config into pyserial constants once; the
+        # config dict itself stays JSON-plain (models.py never imports
+        # pyserial), so the translation lives here
+        flow = config.get("flow_control", "none")
+        self._serial_kwargs = {
+            "port": config.get("port", ""),
+            "baudrate": config.get("baudrate", 9600),
+            "bytesize": config.get("bytesize", 8),
+            "parity": self.PARITY_MAP.get(config.get("parity", "N"), serial.PARITY_NONE),
+            "stopbits": self.STOPBITS_MAP.get(config.get("stopbits", 1), serial.STOPBITS_ONE),
+            "xonxoff": flow == "xonxoff",
+            "rtscts": flow == "rtscts",
+            "timeout": 1,
+        }
+
     def connect(self) -> bool:
         """Establish serial connection"""
         try:
-            parity = self.PARITY_MAP.get(
-                self.config.get("parity", "N"), 
-                serial.PARITY_NONE
-            )
-            stopbits = self.STOPBITS_MAP.get(
-                self.config.get("stopbits", 1), 
-                serial.STOPBITS_ONE
-            )
-            flow = self.config.get("flow_control", "none")
-            
-            self.serial_conn = serial.Serial(
-                port=self.config.get("port", ""),
-                baudrate=self.config.get("baudrate", 9600),
-                bytesize=self.config.get("bytesize", 8),
-                parity=parity,
-                stopbits=stopbits,
-                xonxoff=(flow == "xonxoff"),
-                rtscts=(flow == "rtscts"),
-                timeout=0.1
-            )
-            
+            self.serial_conn = serial.Serial(**self._serial_kwargs)
+
             self.running = True
-            self.thread = threading.Thread(target=self._read_loop, daemon=True)
-            self.thread.start()
-            
+            _reactor.register(self.serial_conn, self._on_readable)
+
             return True
-            
+
         except Exception as e:
             self.on_error(f"Serial connection failed: {e}")
             return False
-    
-    def _read_loop(self):
-        """Background thread reading from serial port"""
-        while self.running and self.serial_conn:
-            try:
-                if self.serial_conn.in_waiting:
-                    data = self.serial_conn.read(self.serial_conn.in_waiting)
-                    if data:
-                        self.on_data(data)
-                time.sleep(0.01)
-            except Exception as e:
-                if self.running:
-                    self.on_error(f"Serial read error: {e}")
-                break
+
+    def _on_readable(self):
+        """Reactor callback: drain whatever is buffered on the port.
+
+        Coalesces whatever trickles in over the next couple of
+        milliseconds — serial data arrives a few bytes at a time and
+        each on_data call costs a signal + redraw.
+        """
+        conn = self.serial_conn
+        if not self.running or conn is None:
+            return
+        try:
+            mv = memoryview(self._rx)
+            total = 0
+            deadline = time.perf_counter() + 0.002
+            while (self.running and total < len(self._rx)
+                   and time.perf_counter() < deadline):
+                waiting = conn.in_waiting
+                if not waiting:
+                    break
+                # Slice to what's actually buffered so readinto never
+                # blocks waiting to fill the whole view
+                take = min(waiting, len(self._rx) - total)
+                n = conn.readinto(mv[total:total + take])
+                if not n:
+                    break
+                total += n
+            if total:
+                self.on_data(bytes(mv[:total]))
+        except Exception as e:
+            _reactor.unregister(conn)
+            if self.running:
+                self.on_error(f"Serial read error: {e}")
     
     def send(self, data: bytes):
         """Send data to serial port"""
@@ -268,8 +442,9 @@ class SerialSession:
     def disconnect(self):
         """Close serial connection"""
         self.running = False
-        
+
         if self.serial_conn:
+            _reactor.unregister(self.serial_conn)
             try:
                 self.serial_conn.close()
             except Exception:
@@ -292,3 +467,20 @@ def list_serial_ports() -> list:
             "hwid": port.hwid or ""
         })
     return ports
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_ports(bucket: int) -> tuple:
+    return tuple(list_serial_ports())
+
+
+def cached_serial_ports(refresh: bool = False) -> list:
+    """List serial ports, reusing the last scan for a ~2 second window.
+
+    Enumerating ports probes /sys and udev on Linux, so dialogs opened
+    back-to-back reuse the previous result. Pass refresh=True (the
+    explicit Refresh buttons) to force a rescan.
+    """
+    if refresh:
+        _cached_ports.cache_clear()
+    return list(_cached_ports(int(time.monotonic() // 2)))
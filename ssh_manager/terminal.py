@@ -3,14 +3,17 @@ Terminal emulator widget using pyte for proper VT100/xterm emulation
 With syntax highlighting for network commands (like MobaXterm)
 """
 
+import functools
 import re
+from itertools import islice
+
 import pyte
 from PyQt5.QtWidgets import QWidget, QApplication
 from PyQt5.QtGui import (
-    QPainter, QColor, QFont, QFontMetrics, QFontDatabase,
+    QPainter, QColor, QFont, QFontMetrics, QFontDatabase, QImage,
     QKeyEvent, QPaintEvent, QResizeEvent
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QSize, QRect
 
 
 # Syntax highlighting rules for network equipment commands
@@ -72,24 +75,39 @@ SYNTAX_RULES = {
     },
 }
 
-# Compile regex patterns for syntax highlighting
-SYNTAX_PATTERNS = {}
-for category, data in SYNTAX_RULES.items():
-    pattern = r'\b(' + '|'.join(re.escape(w) for w in data['words']) + r')\b'
-    SYNTAX_PATTERNS[category] = {
-        'pattern': re.compile(pattern, re.IGNORECASE),
-        'color': data['color']
-    }
-
 # IP address pattern
 IP_PATTERN = re.compile(r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(?:/\d{1,2})?)\b')
 IP_COLOR = '#94e2d5'  # Teal
 
+# All rules merged into one alternation with a named group per
+# category, so highlighting a line is a single regex pass instead of
+# one scan per category. The IP group comes first so addresses win
+# over keyword matches at the same position.
+_GROUP_COLORS = {'ip': IP_COLOR}
+_parts = [r'(?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(?:/\d{1,2})?)']
+for category, data in SYNTAX_RULES.items():
+    _parts.append('(?P<%s>%s)' % (
+        category, '|'.join(re.escape(w) for w in data['words'])))
+    _GROUP_COLORS[category] = data['color']
+SYNTAX_PATTERN = re.compile(r'\b(?:' + '|'.join(_parts) + r')\b', re.IGNORECASE)
+del _parts
+
+# Cheap pre-filter: every rule needs at least one alphanumeric, so
+# separator rows ("-----", box drawing) skip the full scan
+_HAS_ALNUM = re.compile(r'[A-Za-z0-9]')
+
 # Numbers pattern
 NUMBER_PATTERN = re.compile(r'\b(\d+)\b')
 NUMBER_COLOR = '#fab387'  # Peach
 
 
+@functools.lru_cache(maxsize=512)
+def _qcolor(spec: str) -> QColor:
+    """Shared QColor pool — parsing '#rrggbb' per cell per frame adds
+    up; the palette cycles through a small set of colors"""
+    return QColor(spec)
+
+
 class TerminalColors:
     """Terminal color palette"""
     
@@ -103,40 +121,61 @@ class TerminalColors:
     DEFAULT_FG = "#cdd6f4"
     DEFAULT_BG = "#1e1e2e"
     CURSOR_COLOR = "#f5e0dc"
-    
+
+    NAME_MAP = {
+        "black": 0, "red": 1, "green": 2, "yellow": 3,
+        "blue": 4, "magenta": 5, "cyan": 6, "white": 7,
+        "brightblack": 8, "brightred": 9, "brightgreen": 10,
+        "brightyellow": 11, "brightblue": 12, "brightmagenta": 13,
+        "brightcyan": 14, "brightwhite": 15,
+    }
+
+    @classmethod
+    def _index_color(cls, code: int) -> str:
+        if code < 16:
+            return cls.PALETTE[code]
+        elif code < 232:
+            code -= 16
+            r = (code // 36) * 51
+            g = ((code // 6) % 6) * 51
+            b = (code % 6) * 51
+            return f"#{r:02x}{g:02x}{b:02x}"
+        else:
+            gray = (code - 232) * 10 + 8
+            return f"#{gray:02x}{gray:02x}{gray:02x}"
+
     @classmethod
     def get_color(cls, code) -> str:
         if code is None or code == "default":
             return None
-        
+
+        # The whole finite input domain (0..255 plus the 16 names) is
+        # precomputed in _COLOR_LUT below; one dict hit replaces the
+        # per-cell string normalization and cube arithmetic
+        hit = _COLOR_LUT.get(code)
+        if hit is not None:
+            return hit
+
         if isinstance(code, str):
             if code.startswith("#"):
                 return code
-            name_map = {
-                "black": 0, "red": 1, "green": 2, "yellow": 3,
-                "blue": 4, "magenta": 5, "cyan": 6, "white": 7,
-                "brightblack": 8, "brightred": 9, "brightgreen": 10,
-                "brightyellow": 11, "brightblue": 12, "brightmagenta": 13,
-                "brightcyan": 14, "brightwhite": 15,
-            }
-            code = name_map.get(code.lower().replace("_", "").replace("-", ""), 7)
-        
+            code = cls.NAME_MAP.get(
+                code.lower().replace("_", "").replace("-", ""), 7)
+
         if isinstance(code, int):
-            if code < 16:
-                return cls.PALETTE[code]
-            elif code < 232:
-                code -= 16
-                r = (code // 36) * 51
-                g = ((code // 6) % 6) * 51
-                b = (code % 6) * 51
-                return f"#{r:02x}{g:02x}{b:02x}"
-            else:
-                gray = (code - 232) * 10 + 8
-                return f"#{gray:02x}{gray:02x}{gray:02x}"
-        
+            return cls._index_color(code)
+
         return cls.DEFAULT_FG
 
 
+# code -> hex for every index and every plain color name
+_COLOR_LUT = {i: TerminalColors._index_color(i) for i in range(256)}
+_COLOR_LUT.update(
+    (name, TerminalColors.PALETTE[idx])
+    for name, idx in TerminalColors.NAME_MAP.items()
+)
+
+
 class TerminalWidget(QWidget):
     """
     Terminal emulator with:
@@ -190,15 +229,27 @@ class TerminalWidget(QWidget):
         
         # Thread-safe updates
         self.data_received.connect(self._do_write_data)
+        # Incoming bytes staged here and fed to pyte once per frame
+        self._pending_bytes = bytearray()
         
-        # Batch updates
+        # Batch updates; repaints are restricted to the rows that
+        # actually changed unless something invalidates the whole view
         self.update_pending = False
+        self._dirty_rows = set()
+        self._dirty_all = True
+        self._last_cursor_row = None
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self._do_update)
         self.update_timer.start(16)
         
         # Cache for syntax-highlighted lines
         self._syntax_cache = {}
+
+        # Per-row rasterized tiles; rows stay cached until pyte marks
+        # them dirty or the selection changes
+        self._row_images = {}
+        self._last_selection = (None, None)
+        self._tile_dpr = None
         
         # Mouse selection
         self.selection_start = None  # (col, row)
@@ -211,6 +262,7 @@ class TerminalWidget(QWidget):
         self._setup_font()
         self._update_colors()
         self._syntax_cache.clear()
+        self._row_images.clear()
         self._schedule_update()
     
     def _setup_font(self):
@@ -239,6 +291,17 @@ class TerminalWidget(QWidget):
         self.char_width = metrics.horizontalAdvance('M')
         self.char_height = metrics.height()
         self.char_ascent = metrics.ascent()
+
+        # Pre-built style variants so the paint path never constructs
+        # a QFont: mask is (bold<<3)|(italic<<2)|(underline<<1)|strike
+        self._font_variants = {0: self.font}
+        for mask in range(1, 16):
+            f = QFont(self.font)
+            f.setBold(bool(mask & 8))
+            f.setItalic(bool(mask & 4))
+            f.setUnderline(bool(mask & 2))
+            f.setStrikeOut(bool(mask & 1))
+            self._font_variants[mask] = f
     
     def _update_colors(self):
         """Update color objects from settings"""
@@ -251,60 +314,131 @@ class TerminalWidget(QWidget):
         self.data_received.emit(data)
     
     def _do_write_data(self, data: bytes):
-        """Process data in main thread"""
+        """Stage data in main thread; fed to pyte on the frame tick so
+        a burst of small chunks costs one parse + paint per frame"""
+        self._pending_bytes += data
+        # While hidden the tick isn't running, and a huge backlog is
+        # better parsed now than held; feed immediately in both cases
+        if not self.update_timer.isActive() or len(self._pending_bytes) >= 1048576:
+            self._flush_pending()
+
+    # Most a single frame tick will parse; anything beyond is deferred
+    # to the next tick so one giant burst can't stall painting
+    FEED_CHUNK = 262144
+
+    def _flush_pending(self):
+        if not self._pending_bytes:
+            return
+        if len(self._pending_bytes) > self.FEED_CHUNK:
+            # Don't cut a UTF-8 sequence at the split point
+            cut = self.FEED_CHUNK
+            while cut > 0 and (self._pending_bytes[cut] & 0xC0) == 0x80:
+                cut -= 1
+            data = bytes(self._pending_bytes[:cut])
+            del self._pending_bytes[:cut]
+        else:
+            data = bytes(self._pending_bytes)
+            del self._pending_bytes[:]
         try:
             text = data.decode('utf-8', errors='replace')
         except Exception:
             text = str(data)
-        
+
         self.stream.feed(text)
-        self.scroll_offset = 0
-        self._syntax_cache.clear()
-        self._schedule_update()
-    
-    def _schedule_update(self):
+        # No cache clear here: spans are keyed on line text, so changed
+        # lines simply miss and stale entries are never looked up
+        if self.scroll_offset:
+            # Snapping back from history redraws everything
+            self.scroll_offset = 0
+            self._schedule_update()
+        else:
+            self._schedule_update(self.screen.dirty)
+
+    def _schedule_update(self, rows=None):
+        """Request a repaint on the next frame tick. With `rows` only
+        those rows are invalidated; without, the whole widget is."""
         self.update_pending = True
-    
+        if rows is None:
+            self._dirty_all = True
+        else:
+            self._dirty_rows.update(rows)
+            # pyte doesn't mark rows dirty for pure cursor movement,
+            # and the cursor block is painted over the tiles rather
+            # than baked in — always cover where it was last drawn
+            # and where it is now
+            self._dirty_rows.add(self.screen.cursor.y)
+            if self._last_cursor_row is not None:
+                self._dirty_rows.add(self._last_cursor_row)
+
     def _do_update(self):
-        if self.update_pending:
+        self._flush_pending()
+        if self.update_pending and self.isVisible():
             self.update_pending = False
-            self.update()
-    
+            if self._dirty_all or not self._dirty_rows:
+                self._dirty_all = False
+                self._dirty_rows.clear()
+                self.update()
+            else:
+                # Bounding rect of the dirty rows: Qt clips the paint
+                # to it, so untouched rows cost nothing
+                lo = min(self._dirty_rows)
+                hi = max(self._dirty_rows)
+                self._dirty_rows.clear()
+                self.update(QRect(0, lo * self.char_height + 2,
+                                  self.width(),
+                                  (hi - lo + 1) * self.char_height))
+
     def _blink_cursor(self):
         self.cursor_visible = not self.cursor_visible
+        self._schedule_update((self.screen.cursor.y,))
+
+    def showEvent(self, event):
+        # Timers only run while the widget can actually paint;
+        # background tabs cost nothing
+        super().showEvent(event)
+        self.cursor_timer.start(500)
+        self.update_timer.start(16)
         self._schedule_update()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.cursor_timer.stop()
+        self.update_timer.stop()
     
     def _get_line_text(self, line) -> str:
         """Extract text from a pyte line"""
-        result = []
-        for i in range(min(self.cols, len(line))):
-            char = line[i]
-            if isinstance(char, str):
-                result.append(char if char else ' ')
-            else:
-                result.append(char.data if char.data else ' ')
-        return ''.join(result)
+        chars = [line[i] for i in range(min(self.cols, len(line)))]
+        return ''.join(
+            (c if isinstance(c, str) else c.data) or ' ' for c in chars
+        )
     
-    def _get_syntax_colors(self, line_text: str) -> dict:
-        """Get syntax highlighting colors for positions in line"""
+    def _get_syntax_colors(self, line_text: str) -> list:
+        """Get sorted (start, end, color) highlight spans for a line.
+
+        Memoized on the line text: cursor blink repaints the same
+        lines twice a second, so most lookups hit the cache instead
+        of re-running the regex.
+        """
         if not self.settings.get('syntax_highlight', True):
-            return {}
-        
-        colors = {}
-        
-        # Check for IP addresses first
-        for match in IP_PATTERN.finditer(line_text):
-            for i in range(match.start(), match.end()):
-                colors[i] = IP_COLOR
-        
-        # Check syntax patterns
-        for category, data in SYNTAX_PATTERNS.items():
-            for match in data['pattern'].finditer(line_text):
-                for i in range(match.start(), match.end()):
-                    if i not in colors:  # Don't override IP colors
-                        colors[i] = data['color']
-        
-        return colors
+            return []
+
+        # Blank rows and bare prompts dominate a terminal screen; no
+        # rule matches fewer than two significant chars, and none
+        # match rows without a single alphanumeric (rulers, borders)
+        if len(line_text.strip()) < 2 or not _HAS_ALNUM.search(line_text):
+            return []
+
+        spans = self._syntax_cache.get(line_text)
+        if spans is None:
+            spans = [
+                (m.start(), m.end(), _GROUP_COLORS[m.lastgroup])
+                for m in SYNTAX_PATTERN.finditer(line_text)
+            ]
+            if len(self._syntax_cache) >= 512:
+                # Drop the oldest entry (dicts iterate in insert order)
+                self._syntax_cache.pop(next(iter(self._syntax_cache)))
+            self._syntax_cache[line_text] = spans
+        return spans
     
     def sizeHint(self) -> QSize:
         return QSize(self.cols * self.char_width + 4, 
@@ -320,26 +454,211 @@ class TerminalWidget(QWidget):
             self.cols = new_cols
             self.rows = new_rows
             self.screen.resize(self.rows, self.cols)
-            self._syntax_cache.clear()
+            self._row_images.clear()
             self.size_changed.emit(self.cols, self.rows)
             self._schedule_update()
     
+    def _flush_run(self, painter, x0, cell_y, baseline, start_col, chars, attrs):
+        """Draw one run of same-attribute cells: a single fillRect for
+        the background and a single drawText for the glyphs (the font
+        is fixed-pitch, so Qt advances exactly char_width per cell)."""
+        if not chars:
+            return
+        fg_color, bg_color, is_bold, is_italic, is_underline, is_strike = attrs
+        text = ''.join(chars)
+        x = start_col * self.char_width + x0
+
+        if bg_color is not None:
+            painter.fillRect(x, cell_y,
+                             self.char_width * len(chars), self.char_height,
+                             bg_color)
+
+        if text.strip():
+            mask = ((is_bold << 3) | (is_italic << 2)
+                    | (is_underline << 1) | is_strike)
+            if mask:
+                painter.setFont(self._font_variants[mask])
+            painter.setPen(fg_color)
+            painter.drawText(x, baseline, text)
+            if mask:
+                painter.setFont(self.font)
+
+    def _paint_line(self, painter, line, line_text, row, x0, cell_y, baseline):
+        """Paint one line onto painter at the given offsets,
+        accumulating contiguous same-attribute cells so each run costs
+        one fillRect + one drawText instead of per-cell painter calls"""
+        syntax_spans = self._get_syntax_colors(line_text)
+        span_idx = 0
+        n_spans = len(syntax_spans)
+
+        # Check if line is from history (string) or buffer (Char objects)
+        is_history_line = isinstance(line[0] if len(line) > 0 else None, str)
+
+        sel_lo, sel_hi = self._row_selection_range(row)
+
+        run_start = 0
+        run_chars = []
+        run_attrs = None
+
+        if is_history_line:
+            # History lines are plain strings: no per-cell attributes,
+            # so only syntax spans and the selection split runs
+            for col in range(min(self.cols, len(line))):
+                char = line[col] if col < len(line) else " "
+
+                fg = None
+                if n_spans:
+                    while span_idx < n_spans and col >= syntax_spans[span_idx][1]:
+                        span_idx += 1
+                    if span_idx < n_spans and syntax_spans[span_idx][0] <= col:
+                        fg = syntax_spans[span_idx][2]
+
+                if sel_lo is not None and sel_lo <= col < sel_hi:
+                    # Selection colors - invert
+                    attrs = (_qcolor("#1e1e2e"), _qcolor("#89b4fa"),
+                             False, False, False, False)
+                else:
+                    attrs = (_qcolor(fg) if fg else self.fg_color, None,
+                             False, False, False, False)
+
+                if attrs != run_attrs:
+                    self._flush_run(painter, x0, cell_y, baseline,
+                                    run_start, run_chars, run_attrs)
+                    run_start = col
+                    run_chars = []
+                    run_attrs = attrs
+                run_chars.append(char)
+        else:
+            # Buffer lines are Char objects
+            for col in range(min(self.cols, len(line))):
+                char_data = line[col]
+                char = char_data.data if char_data.data else " "
+                fg_name = char_data.fg
+                bg_name = char_data.bg
+                is_bold = char_data.bold
+                is_italic = char_data.italics
+                is_underline = char_data.underscore
+                is_strike = char_data.strikethrough
+                is_reverse = char_data.reverse
+
+                # Bold = bright colors
+                if is_bold and fg_name in ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white'):
+                    fg_name = 'bright' + fg_name
+
+                fg = TerminalColors.get_color(fg_name)
+                bg = TerminalColors.get_color(bg_name)
+
+                # Apply syntax highlighting if no color from terminal;
+                # spans are sorted, so a single pointer advancing with
+                # col replaces a per-cell dict lookup
+                if fg is None and n_spans:
+                    while span_idx < n_spans and col >= syntax_spans[span_idx][1]:
+                        span_idx += 1
+                    if span_idx < n_spans and syntax_spans[span_idx][0] <= col:
+                        fg = syntax_spans[span_idx][2]
+
+                fg_color = _qcolor(fg) if fg else self.fg_color
+                bg_color = _qcolor(bg) if bg else self.bg_color
+
+                if is_reverse:
+                    fg_color, bg_color = bg_color, fg_color
+
+                # Check if cell is selected
+                is_selected = sel_lo is not None and sel_lo <= col < sel_hi
+                if is_selected:
+                    # Selection colors - invert
+                    bg_color = _qcolor("#89b4fa")  # Selection highlight
+                    fg_color = _qcolor("#1e1e2e")  # Dark text on selection
+
+                draw_bg = bool(bg) or is_reverse or is_selected
+                attrs = (fg_color, bg_color if draw_bg else None,
+                         is_bold, is_italic, is_underline, is_strike)
+                if attrs != run_attrs:
+                    self._flush_run(painter, x0, cell_y, baseline,
+                                    run_start, run_chars, run_attrs)
+                    run_start = col
+                    run_chars = []
+                    run_attrs = attrs
+                run_chars.append(char)
+
+        self._flush_run(painter, x0, cell_y, baseline,
+                        run_start, run_chars, run_attrs)
+
+    def _render_row_image(self, line, line_text, row) -> QImage:
+        """Rasterize one row into a reusable tile"""
+        # Tiles carry the widget's device pixel ratio so text stays
+        # sharp on HiDPI displays instead of being upscaled from 1x
+        dpr = self.devicePixelRatioF()
+        img = QImage(int(self.cols * self.char_width * dpr),
+                     int(self.char_height * dpr),
+                     QImage.Format_RGB32)
+        img.setDevicePixelRatio(dpr)
+        img.fill(self.bg_color)
+        p = QPainter(img)
+        p.setFont(self.font)
+        self._paint_line(p, line, line_text, row, 0, 0, self.char_ascent)
+        p.end()
+        return img
+
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
         painter.setFont(self.font)
-        painter.fillRect(self.rect(), self.bg_color)
-        
-        history_top = list(self.screen.history.top) if self.screen.history.top else []
-        total_history = len(history_top)
-        
-        for row in range(self.rows):
-            y = row * self.char_height + self.char_ascent + 2
-            
-            # Get line based on scroll position
-            if self.scroll_offset > 0:
+        clip = event.rect()
+        painter.fillRect(clip, self.bg_color)
+
+        if self.scroll_offset == 0:
+            # Live screen: blit cached row tiles, re-rasterizing only
+            # rows pyte marked dirty since the last paint (plus any
+            # rows invalidated by a selection change)
+            dpr = self.devicePixelRatioF()
+            if dpr != self._tile_dpr:
+                # Dragged to a screen with a different scale factor;
+                # 1x-for-2x (or vice versa) tiles would blit blurry
+                self._row_images.clear()
+                self._tile_dpr = dpr
+
+            sel = (self.selection_start, self.selection_end)
+            if sel != self._last_selection:
+                self._row_images.clear()
+                self._last_selection = sel
+            for r in self.screen.dirty:
+                self._row_images.pop(r, None)
+            self.screen.dirty.clear()
+
+            # Only touch rows the update rect intersects; dirty-row
+            # updates clip the paint to a few rows
+            row_lo = max(0, (clip.top() - 2) // self.char_height)
+            row_hi = min(self.rows - 1,
+                         (clip.bottom() - 2) // self.char_height)
+
+            display = self.screen.display
+            for row in range(row_lo, row_hi + 1):
+                if row >= len(self.screen.buffer):
+                    continue
+                img = self._row_images.get(row)
+                if img is None:
+                    line = self.screen.buffer[row]
+                    if row < len(display):
+                        line_text = display[row]
+                    else:
+                        line_text = self._get_line_text(line)
+                    img = self._render_row_image(line, line_text, row)
+                    self._row_images[row] = img
+                painter.drawImage(2, row * self.char_height + 2, img)
+        else:
+            # Scrolled into history: paint directly, no tile cache.
+            # Materialize only the visible window of the 10k-entry
+            # deque instead of the whole thing
+            history = self.screen.history.top
+            total_history = len(history) if history else 0
+            win_start = max(0, total_history - self.scroll_offset)
+            window = list(islice(history, win_start,
+                                 min(total_history, win_start + self.rows)))
+
+            for row in range(self.rows):
                 history_idx = total_history - self.scroll_offset + row
                 if 0 <= history_idx < total_history:
-                    line = history_top[history_idx]
+                    line = window[history_idx - win_start]
                 elif history_idx >= total_history:
                     buffer_idx = history_idx - total_history
                     if buffer_idx < len(self.screen.buffer):
@@ -348,92 +667,16 @@ class TerminalWidget(QWidget):
                         continue
                 else:
                     continue
-            else:
-                if row < len(self.screen.buffer):
-                    line = self.screen.buffer[row]
-                else:
-                    continue
-            
-            # Get syntax highlighting for this line
-            line_text = self._get_line_text(line)
-            syntax_colors = self._get_syntax_colors(line_text)
-            
-            # Check if line is from history (string) or buffer (Char objects)
-            is_history_line = isinstance(line[0] if len(line) > 0 else None, str)
-            
-            for col in range(min(self.cols, len(line))):
-                if is_history_line:
-                    # History lines are plain strings
-                    char = line[col] if col < len(line) else " "
-                    fg_name = "default"
-                    bg_name = "default"
-                    is_bold = False
-                    is_italic = False
-                    is_underline = False
-                    is_strike = False
-                    is_reverse = False
-                else:
-                    # Buffer lines are Char objects
-                    char_data = line[col]
-                    char = char_data.data if char_data.data else " "
-                    fg_name = char_data.fg
-                    bg_name = char_data.bg
-                    is_bold = char_data.bold
-                    is_italic = char_data.italics
-                    is_underline = char_data.underscore
-                    is_strike = char_data.strikethrough
-                    is_reverse = char_data.reverse
-                    
-                    # Bold = bright colors
-                    if is_bold and fg_name in ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white'):
-                        fg_name = 'bright' + fg_name
-                
-                fg = TerminalColors.get_color(fg_name)
-                bg = TerminalColors.get_color(bg_name)
-                
-                # Apply syntax highlighting if no color from terminal
-                if fg is None and col in syntax_colors:
-                    fg = syntax_colors[col]
-                
-                fg_color = QColor(fg) if fg else self.fg_color
-                bg_color = QColor(bg) if bg else self.bg_color
-                
-                if is_reverse:
-                    fg_color, bg_color = bg_color, fg_color
-                
-                x = col * self.char_width + 2
+
+                line_text = self._get_line_text(line)
                 cell_y = row * self.char_height + 2
-                
-                # Check if cell is selected
-                is_selected = self._is_cell_selected(col, row)
-                if is_selected:
-                    # Selection colors - invert
-                    bg_color = QColor("#89b4fa")  # Selection highlight
-                    fg_color = QColor("#1e1e2e")  # Dark text on selection
-                
-                # Draw background
-                if bg or is_reverse or is_selected:
-                    painter.fillRect(x, cell_y, self.char_width, self.char_height, bg_color)
-                
-                # Draw character
-                if char and char != " ":
-                    font = QFont(self.font)
-                    if is_bold:
-                        font.setBold(True)
-                    if is_italic:
-                        font.setItalic(True)
-                    if is_underline:
-                        font.setUnderline(True)
-                    if is_strike:
-                        font.setStrikeOut(True)
-                    
-                    painter.setFont(font)
-                    painter.setPen(fg_color)
-                    painter.drawText(x, y, char)
-                    painter.setFont(self.font)
-        
+                baseline = row * self.char_height + self.char_ascent + 2
+                self._paint_line(painter, line, line_text, row,
+                                 2, cell_y, baseline)
+
         # Draw cursor
         if self.cursor_visible and self.hasFocus() and self.scroll_offset == 0:
+            self._last_cursor_row = self.screen.cursor.y
             cursor_x = self.screen.cursor.x * self.char_width + 2
             cursor_y = self.screen.cursor.y * self.char_height + 2
             
@@ -677,30 +920,41 @@ class TerminalWidget(QWidget):
         
         return '\n'.join(line.rstrip() for line in lines)
     
-    def _is_cell_selected(self, col, row):
-        """Check if a cell is within the current selection"""
+    def _row_selection_range(self, row):
+        """Selected [lo, hi) column bounds for a row, or (None, None).
+
+        Computed once per row so the paint loop tests a plain range
+        instead of re-normalizing the selection per cell.
+        """
         if not self.selection_start or not self.selection_end:
-            return False
-        
+            return (None, None)
+
         start_col, start_row = self.selection_start
         end_col, end_row = self.selection_end
-        
+
         # Normalize
         if (start_row > end_row) or (start_row == end_row and start_col > end_col):
             start_col, end_col = end_col, start_col
             start_row, end_row = end_row, start_row
-        
+
         if row < start_row or row > end_row:
-            return False
-        
-        if row == start_row and row == end_row:
-            return start_col <= col < end_col
+            return (None, None)
+
+        if start_row == end_row:
+            if start_col == end_col:
+                return (None, None)
+            return (start_col, end_col)
         elif row == start_row:
-            return col >= start_col
+            return (start_col, self.cols)
         elif row == end_row:
-            return col < end_col
+            return (0, end_col)
         else:
-            return True
+            return (0, self.cols)
+
+    def _is_cell_selected(self, col, row):
+        """Check if a cell is within the current selection"""
+        lo, hi = self._row_selection_range(row)
+        return lo is not None and lo <= col < hi
     
     def clear_selection(self):
         """Clear the current selection"""
@@ -726,6 +980,7 @@ class TerminalWidget(QWidget):
     def clear_terminal(self):
         self.screen.reset()
         self._syntax_cache.clear()
+        self._row_images.clear()
         self._schedule_update()
     
     def get_terminal_size(self) -> tuple: